@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from io import BytesIO
-from typing import List
+from typing import Any, Callable, List
+from weakref import WeakKeyDictionary, WeakValueDictionary, ref
 
 # NOTE aliasing the imports with 'as' makes them public in the eyes
 # of static code checkers. Thus we avoid listing them with __all__ = ...
+from ._cache import LRUCache, TTLCache
+from ._internal import ListIterator as ListIterator
 from ._internal import ListResult as ListResult
 from ._internal import ObjectMeta as ObjectMeta
 from ._internal import ObjectStore as _ObjectStore
 from ._internal import Path as Path
+from ._internal import RangeIterator as RangeIterator
 
 try:
     import importlib.metadata as importlib_metadata
@@ -18,68 +22,127 @@ except ImportError:
 __version__ = importlib_metadata.version("object-store-python")
 
 PathLike = str | List[str] | Path
-BytesLike = bytes | BytesIO
+BytesLike = bytes | bytearray | memoryview | BytesIO
 
 DELIMITER = "/"
 
 
-def _as_path(raw: PathLike) -> Path:
-    if isinstance(raw, str):
-        return Path(raw)
-    if isinstance(raw, list):
-        return Path(DELIMITER.join(raw))
-    if isinstance(raw, Path):
-        return raw
-    raise ValueError(f"Cannot convert type '{type(raw)}' to type Path.")
+def _bytes_identity(raw: bytes) -> bytes:
+    return raw
+
+
+# dispatching on the exact type avoids walking the isinstance chain on every call,
+# subclasses fall back to the slower isinstance lookup.
+_BYTES_DISPATCH: dict[type, Callable[[Any], bytes]] = {
+    bytes: _bytes_identity,
+    bytearray: bytes,
+    memoryview: bytes,
+    # the whole buffer, independent of the current stream position
+    BytesIO: BytesIO.getvalue,
+}
+
+
+def _dispatch(dispatch: dict[type, Callable[[Any], Any]], raw: Any) -> Callable[[Any], Any] | None:
+    try:
+        return dispatch[type(raw)]
+    except KeyError:
+        for type_, handler in dispatch.items():
+            if isinstance(raw, type_):
+                return handler
+    return None
 
 
 def _as_bytes(raw: BytesLike) -> bytes:
-    if isinstance(raw, bytes):
-        return raw
-    if isinstance(raw, BytesIO):
-        return raw.read()
-    raise ValueError(f"Cannot convert type '{type(raw)}' to type bytes.")
+    handler = _dispatch(_BYTES_DISPATCH, raw)
+    if handler is None:
+        raise ValueError(f"Cannot convert type '{type(raw)}' to type bytes.")
+    return handler(raw)
 
 
-class ObjectStore(_ObjectStore):
-    """A uniform API for interacting with object storage services and local files.
+# stores created via ObjectStore.get_or_create, keyed by class, root and options. Stores
+# own a runtime with its own worker threads, so they are only kept while in use elsewhere.
+_STORE_CACHE: WeakValueDictionary[tuple[type, str, frozenset[tuple[str, str]]], ObjectStore] = WeakValueDictionary()
 
-    backed by the Rust object_store crate."""
 
-    def head(self, location: PathLike) -> ObjectMeta:
-        """Return the metadata for the specified location.
+def _cache_key(location: PathLike) -> str:
+    return str(Path(location))
 
-        Args:
-            location (PathLike): path / key to storage location
 
-        Returns:
-            ObjectMeta: metadata for object at location
-        """
-        return super().head(_as_path(location))
+class ObjectStore(_ObjectStore):
+    """A uniform API for interacting with object storage services and local files.
 
-    def get(self, location: PathLike) -> bytes:
-        """Return the bytes that are stored at the specified location.
+    backed by the Rust object_store crate.
+
+    All methods accept any `PathLike` as location, which is converted to a `Path` on the Rust side."""
+
+    def __new__(
+        cls,
+        root: str,
+        options: dict[str, str] | None = None,
+        max_in_flight: int | None = 64,
+        *,
+        meta_cache_size: int = 0,
+        negative_cache_size: int = 0,
+        list_cache_size: int = 0,
+        list_cache_ttl: float = 5.0,
+    ) -> ObjectStore:
+        # only stores with caches enabled pay for the cache bookkeeping, all others
+        # call straight into the Rust implementation.
+        if meta_cache_size > 0 or negative_cache_size > 0 or list_cache_size > 0:
+            cls = _caching_class(cls)
+        return super().__new__(cls, root, options, max_in_flight)
+
+    def __init__(
+        self,
+        root: str,
+        options: dict[str, str] | None = None,
+        max_in_flight: int | None = 64,
+        *,
+        meta_cache_size: int = 0,
+        negative_cache_size: int = 0,
+        list_cache_size: int = 0,
+        list_cache_ttl: float = 5.0,
+    ) -> None:
+        """Create a new ObjectStore instance.
+
+        Caches only see operations issued through this instance, enable them only if no
+        other process modifies the objects accessed via this store.
 
         Args:
-            location (PathLike): path / key to storage location
-
-        Returns:
-            bytes: raw data stored in location
+            root (str): url of the storage root
+            options (dict[str, str] | None, optional): storage backend configuration. Defaults to None.
+            max_in_flight (int | None, optional): maximum number of concurrent requests issued
+                by this store, None disables the limit. Listings of `iter_list` and files opened
+                by an `ArrowFileSystemHandler` sharing this store are not limited. Defaults to 64.
+            meta_cache_size (int, optional): number of `head` results to cache. Defaults to 0 (disabled).
+            negative_cache_size (int, optional): number of missing locations to remember.
+                Defaults to 0 (disabled).
+            list_cache_size (int, optional): number of `list` results to cache. Any modification
+                through this store clears the cache. Defaults to 0 (disabled).
+            list_cache_ttl (float, optional): seconds after which cached `list` results expire.
+                Defaults to 5.0.
         """
-        return super().get(_as_path(location))
 
-    def get_range(self, location: PathLike, start: int, length: int) -> bytes:
-        """Return the bytes that are stored at the specified location in the given byte range.
+    @classmethod
+    def get_or_create(cls, root: str, options: dict[str, str] | None = None) -> ObjectStore:
+        """Return a store for the given root and options, reusing a previously created one.
+
+        Creating a store resolves credentials and sets up a new connection pool, sharing
+        stores avoids paying for this repeatedly, e.g. when opening many datasets. Stores
+        are shared only as long as they are referenced somewhere else.
 
         Args:
-            location (PathLike): path / key to storage location
-            start (int): zero-based start index
-            length (int): length of the byte range
+            root (str): url of the storage root
+            options (dict[str, str] | None, optional): storage backend configuration. Defaults to None.
 
         Returns:
-            bytes: raw data range stored in location
+            ObjectStore: the shared store instance
         """
-        return super().get_range(_as_path(location), start, length)
+        key = (cls, root, frozenset((options or {}).items()))
+        store = _STORE_CACHE.get(key)
+        if store is None:
+            store = _STORE_CACHE.setdefault(key, cls(root, options))
+        return store
 
     def put(self, location: PathLike, bytes: BytesLike) -> None:
         """Save the provided bytes to the specified location.
@@ -88,91 +151,217 @@ class ObjectStore(_ObjectStore):
             location (PathLike): path / key to storage location
             bytes (BytesLike): data to be written to location
         """
-        return super().put(_as_path(location), _as_bytes(bytes))
+        return super().put(location, _as_bytes(bytes))
 
-    def delete(self, location: PathLike) -> None:
-        """Delete the object at the specified location.
+    def put_many(self, items: list[tuple[PathLike, BytesLike]], max_concurrency: int = 64) -> None:
+        """Save the provided bytes to the specified locations.
+
+        All objects are uploaded concurrently, with at most `max_concurrency` requests in flight.
 
         Args:
-            location (PathLike): path / key to storage location
+            items (list[tuple[PathLike, BytesLike]]): pairs of path / key and data to be written
+            max_concurrency (int, optional): maximum number of concurrent requests. Defaults to 64.
         """
-        return super().delete(_as_path(location))
+        return super().put_many([(location, _as_bytes(data)) for location, data in items], max_concurrency)
 
-    def list(self, prefix: PathLike | None = None) -> list[ObjectMeta]:
-        """List all the objects with the given prefix.
+    def put_multipart(self, location: PathLike, bytes: BytesLike, part_size: int = 10 * 1024 * 1024) -> None:
+        """Save the provided bytes to the specified location using a multipart upload.
 
-        Prefixes are evaluated on a path segment basis, i.e. `foo/bar/` is a prefix
-        of `foo/bar/x` but not of `foo/bar_baz/x`.
+        The data is uploaded in parts of `part_size` bytes, only the last part may be smaller.
+        Parts are uploaded concurrently.
 
         Args:
-            prefix (PathLike | None, optional): path prefix to filter limit list results. Defaults to None.
-
-        Returns:
-            list[ObjectMeta]: ObjectMeta for all objects under the listed path
+            location (PathLike): path / key to storage location
+            bytes (BytesLike): data to be written to location
+            part_size (int, optional): size of the uploaded parts in bytes, at least 5 MiB. Defaults to 10 MiB.
         """
-        prefix_ = _as_path(prefix) if prefix else None
-        return super().list(prefix_)
+        return super().put_multipart(location, _as_bytes(bytes), part_size)
+
+
+# caching variants of ObjectStore and its subclasses. Both are only referenced weakly, so
+# locally defined subclasses are released along with their last caching instance.
+_CACHING_CLASSES: WeakKeyDictionary[type, ref[type]] = WeakKeyDictionary()
+
+
+def _caching_class(cls: type) -> type:
+    if issubclass(cls, _CachingMixin):
+        return cls
+    cached = _CACHING_CLASSES.get(cls)
+    caching_cls = cached() if cached is not None else None
+    if caching_cls is None:
+        caching_cls = type(f"_Caching{cls.__name__}", (_CachingMixin, cls), {"_store_class": cls})
+        _CACHING_CLASSES[cls] = ref(caching_cls)
+    return caching_cls
+
+
+def _new_caching_store(cls: type, *args: Any) -> ObjectStore:
+    caching_cls = _caching_class(cls)
+    return caching_cls.__new__(caching_cls, *args)
+
+
+class _CachingMixin(ObjectStore):
+    """Overrides of ObjectStore methods adding metadata, negative lookup and listing caches.
+
+    Mixed into `ObjectStore` or the requested subclass when any of the caches is enabled."""
+
+    _store_class: type
+
+    def __init__(
+        self,
+        root: str,
+        options: dict[str, str] | None = None,
+        max_in_flight: int | None = 64,
+        *,
+        meta_cache_size: int = 0,
+        negative_cache_size: int = 0,
+        list_cache_size: int = 0,
+        list_cache_ttl: float = 5.0,
+    ) -> None:
+        self._init_caches(meta_cache_size, negative_cache_size, list_cache_size, list_cache_ttl)
+        super().__init__(
+            root,
+            options,
+            max_in_flight=max_in_flight,
+            meta_cache_size=meta_cache_size,
+            negative_cache_size=negative_cache_size,
+            list_cache_size=list_cache_size,
+            list_cache_ttl=list_cache_ttl,
+        )
+
+    def _init_caches(
+        self, meta_cache_size: int, negative_cache_size: int, list_cache_size: int, list_cache_ttl: float
+    ) -> None:
+        self._meta_cache = LRUCache(meta_cache_size) if meta_cache_size > 0 else None
+        self._negative_cache = LRUCache(negative_cache_size) if negative_cache_size > 0 else None
+        self._list_cache = TTLCache(list_cache_size, list_cache_ttl) if list_cache_size > 0 else None
+        self._list_cache_ttl = list_cache_ttl
+
+    def __getstate__(self) -> dict[str, float]:
+        return {
+            "meta_cache_size": self._meta_cache.maxsize if self._meta_cache is not None else 0,
+            "negative_cache_size": self._negative_cache.maxsize if self._negative_cache is not None else 0,
+            "list_cache_size": self._list_cache.maxsize if self._list_cache is not None else 0,
+            "list_cache_ttl": self._list_cache_ttl,
+        }
+
+    def __setstate__(self, state: dict[str, float]) -> None:
+        self._init_caches(**state)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # the caching class cannot be looked up by name, so it is recreated from the class it extends
+        return _new_caching_store, (self._store_class, *self.__getnewargs__()), self.__getstate__()
+
+    def _invalidate(self, *locations: PathLike) -> None:
+        if self._list_cache is not None:
+            self._list_cache.clear()
+        for location in locations:
+            key = _cache_key(location)
+            if self._meta_cache is not None:
+                self._meta_cache.pop(key)
+            if self._negative_cache is not None:
+                self._negative_cache.pop(key)
+
+    def _check_not_found(self, key: str) -> None:
+        if self._negative_cache is not None and key in self._negative_cache:
+            raise FileNotFoundError(f"Object at location {key} not found")
 
-    def list_with_delimiter(self, prefix: PathLike | None = None) -> ListResult:
-        """List objects with the given prefix and an implementation specific
-        delimiter. Returns common prefixes (directories) in addition to object
-        metadata.
+    def head(self, location: PathLike) -> ObjectMeta:
+        key = _cache_key(location)
+        self._check_not_found(key)
+        meta = self._meta_cache.get(key) if self._meta_cache is not None else None
+        if meta is not None:
+            return meta
+
+        try:
+            meta = super().head(location)
+        except FileNotFoundError:
+            if self._negative_cache is not None:
+                self._negative_cache.put(key)
+            raise
+
+        if self._meta_cache is not None:
+            self._meta_cache.put(key, meta)
+        return meta
 
-        Prefixes are evaluated on a path segment basis, i.e. `foo/bar/` is a prefix
-        of `foo/bar/x` but not of `foo/bar_baz/x`.
+    def get(self, location: PathLike) -> bytes:
+        if self._negative_cache is None:
+            return super().get(location)
+
+        key = _cache_key(location)
+        self._check_not_found(key)
+        try:
+            return super().get(location)
+        except FileNotFoundError:
+            self._negative_cache.put(key)
+            raise
+
+    def list(self, prefix: PathLike | None = None, max_keys: int | None = None) -> list[ObjectMeta]:
+        if self._list_cache is None:
+            return super().list(prefix, max_keys)
+
+        key = (_cache_key(prefix) if prefix is not None else None, max_keys)
+        result = self._list_cache.get(key)
+        if result is None:
+            result = super().list(prefix, max_keys)
+            self._list_cache.put(key, result)
+        # hand out copies, so callers cannot modify the cached result
+        return result.copy()
+
+    # caches are invalidated even if an operation fails, as it may have partially succeeded,
+    # e.g. a rename that copied the object but failed to delete the source.
 
-        Args:
-            prefix (PathLike | None, optional): path prefix to filter limit list results. Defaults to None.
+    def put(self, location: PathLike, bytes: BytesLike) -> None:
+        try:
+            super().put(location, bytes)
+        finally:
+            self._invalidate(location)
+
+    def put_many(self, items: list[tuple[PathLike, BytesLike]], max_concurrency: int = 64) -> None:
+        items = list(items)
+        try:
+            super().put_many(items, max_concurrency)
+        finally:
+            self._invalidate(*(location for location, _ in items))
+
+    def put_multipart(self, location: PathLike, bytes: BytesLike, part_size: int = 10 * 1024 * 1024) -> None:
+        try:
+            super().put_multipart(location, bytes, part_size)
+        finally:
+            self._invalidate(location)
 
-        Returns:
-            list[ObjectMeta]: ObjectMeta for all objects under the listed path
-        """
-        prefix_ = _as_path(prefix) if prefix else None
-        return super().list_with_delimiter(prefix_)
+    def delete(self, location: PathLike) -> None:
+        try:
+            super().delete(location)
+        finally:
+            self._invalidate(location)
+
+    def delete_many(self, locations: list[PathLike], max_concurrency: int = 64) -> None:
+        locations = list(locations)
+        try:
+            super().delete_many(locations, max_concurrency)
+        finally:
+            self._invalidate(*locations)
 
     def copy(self, src: PathLike, dst: PathLike) -> None:
-        """Copy an object from one path to another in the same object store.
-
-        If there exists an object at the destination, it will be overwritten.
-
-        Args:
-            src (PathLike): source path
-            dst (PathLike): destination path
-        """
-        return super().copy(_as_path(src), _as_path(dst))
+        try:
+            super().copy(src, dst)
+        finally:
+            self._invalidate(src, dst)
 
     def copy_if_not_exists(self, src: PathLike, dst: PathLike) -> None:
-        """Copy an object from one path to another, only if destination is empty.
-
-        Will return an error if the destination already has an object.
-
-        Args:
-            src (PathLike): source path
-            dst (PathLike): destination path
-        """
-        return super().copy_if_not_exists(_as_path(src), _as_path(dst))
+        try:
+            super().copy_if_not_exists(src, dst)
+        finally:
+            self._invalidate(src, dst)
 
     def rename(self, src: PathLike, dst: PathLike) -> None:
-        """Move an object from one path to another in the same object store.
-
-        By default, this is implemented as a copy and then delete source. It may not
-        check when deleting source that it was the same object that was originally copied.
-
-        If there exists an object at the destination, it will be overwritten.
-
-        Args:
-            src (PathLike): source path
-            dst (PathLike): destination path
-        """
-        return super().rename(_as_path(src), _as_path(dst))
+        try:
+            super().rename(src, dst)
+        finally:
+            self._invalidate(src, dst)
 
     def rename_if_not_exists(self, src: PathLike, dst: PathLike) -> None:
-        """Move an object from one path to another in the same object store.
-
-        Will return an error if the destination already has an object.
-
-        Args:
-            src (PathLike): source path
-            dst (PathLike): destination path
-        """
-        return super().rename_if_not_exists(_as_path(src), _as_path(dst))
+        try:
+            super().rename_if_not_exists(src, dst)
+        finally:
+            self._invalidate(src, dst)
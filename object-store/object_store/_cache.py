@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUCache:
+    """A bounded mapping that evicts the least recently used entries."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            self._data.move_to_end(key)
+            return self._data[key]
+        except KeyError:
+            return default
+
+    def put(self, key: Hashable, value: Any = None) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+_MISSING = object()
+
+
+class TTLCache(LRUCache):
+    """A bounded mapping whose entries expire `ttl` seconds after they were added."""
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic) -> None:
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self._timer = timer
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = super().get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires, value = entry
+        if expires <= self._timer():
+            self.pop(key)
+            return default
+        return value
+
+    def put(self, key: Hashable, value: Any = None) -> None:
+        super().put(key, (self._timer() + self.ttl, value))
@@ -5,9 +5,13 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import pyarrow.fs as fs
 
+PathLike = str | list[str] | Path
+
 class Path:
-    def __init__(self, raw: str | list[str]) -> None: ...
+    def __init__(self, raw: PathLike) -> None: ...
     def child(self, part: str) -> Path: ...
+    def __hash__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
 
 class ObjectMeta:
     """The metadata that describes an object."""
@@ -32,56 +36,251 @@ class ListResult:
     def objects(self) -> list[ObjectMeta]:
         """Object metadata for the listing"""
 
+class ListIterator:
+    """Iterator over listed objects, which are fetched in the background while iterating."""
+
+    def __iter__(self) -> ListIterator: ...
+    def __next__(self) -> ObjectMeta: ...
+
+class RangeIterator:
+    """Iterator over `(index, bytes)` of requested byte ranges, in the order they are fetched."""
+
+    def __iter__(self) -> RangeIterator: ...
+    def __next__(self) -> tuple[int, bytes]: ...
+
 class ObjectStore:
     """A uniform API for interacting with object storage services and local files."""
 
-    def __init__(self, root: str, options: dict[str, str] | None = None) -> None: ...
-    def get(self, location: Path) -> bytes:
-        """Return the bytes that are stored at the specified location."""
-    def get_range(self, location: Path, start: int, length: int) -> bytes:
-        """Return the bytes that are stored at the specified location in the given byte range."""
-    def put(self, location: Path, bytes: bytes) -> None:
-        """Save the provided bytes to the specified location."""
-    def list(self, prefix: Path | None) -> list[ObjectMeta]:
+    def __init__(self, root: str, options: dict[str, str] | None = None, max_in_flight: int | None = 64) -> None:
+        """Create a new ObjectStore instance.
+
+        At most `max_in_flight` requests are issued concurrently, across all operations
+        on this instance.
+
+        Args:
+            root (str): url of the storage root
+            options (dict[str, str] | None, optional): storage backend configuration. Defaults to None.
+            max_in_flight (int | None, optional): maximum number of concurrent requests issued
+                by this store, None disables the limit. Defaults to 64.
+        """
+    def get(self, location: PathLike) -> bytes:
+        """Return the bytes that are stored at the specified location.
+
+        Args:
+            location (PathLike): path / key to storage location
+
+        Returns:
+            bytes: raw data stored in location
+        """
+    def get_range(self, location: PathLike, start: int, length: int) -> bytes:
+        """Return the bytes that are stored at the specified location in the given byte range.
+
+        Args:
+            location (PathLike): path / key to storage location
+            start (int): zero-based start index
+            length (int): length of the byte range
+
+        Returns:
+            bytes: raw data range stored in location
+        """
+    def get_many(self, locations: list[PathLike], max_concurrency: int = 64) -> list[bytes]:
+        """Return the bytes that are stored at each of the specified locations.
+
+        All objects are fetched concurrently, with at most `max_concurrency` requests in flight.
+
+        Args:
+            locations (list[PathLike]): paths / keys to storage locations
+            max_concurrency (int, optional): maximum number of concurrent requests. Defaults to 64.
+
+        Returns:
+            list[bytes]: raw data stored in each location, in the order of `locations`
+        """
+    def get_ranges(self, location: PathLike, ranges: list[tuple[int, int]], max_concurrency: int = 64) -> list[bytes]:
+        """Return the bytes that are stored at the specified location in the given byte ranges.
+
+        Nearby ranges are coalesced into larger requests, which are issued concurrently.
+
+        Args:
+            location (PathLike): path / key to storage location
+            ranges (list[tuple[int, int]]): `(start, length)` of each byte range
+            max_concurrency (int, optional): maximum number of concurrent requests. Defaults to 64.
+
+        Returns:
+            list[bytes]: raw data of each range, in the order of `ranges`
+        """
+    def get_ranges_stream(
+        self, location: PathLike, ranges: list[tuple[int, int]], max_concurrency: int = 64
+    ) -> RangeIterator:
+        """Return an iterator over the given byte ranges, yielding each range as soon as it is fetched.
+
+        Nearby ranges are coalesced into larger requests, which are issued concurrently. Ranges
+        are yielded in the order their requests complete, not in the order of `ranges`.
+
+        Args:
+            location (PathLike): path / key to storage location
+            ranges (list[tuple[int, int]]): `(start, length)` of each byte range
+            max_concurrency (int, optional): maximum number of concurrent requests. Defaults to 64.
+
+        Returns:
+            RangeIterator: iterator over `(index, bytes)`, where `index` is the position of the range in `ranges`
+        """
+    def put(self, location: PathLike, bytes: bytes) -> None:
+        """Save the provided bytes to the specified location.
+
+        Args:
+            location (PathLike): path / key to storage location
+            bytes (bytes): data to be written to location
+        """
+    def put_many(self, items: list[tuple[PathLike, bytes]], max_concurrency: int = 64) -> None:
+        """Save the provided bytes to the specified locations.
+
+        All objects are uploaded concurrently, with at most `max_concurrency` requests in flight.
+
+        Args:
+            items (list[tuple[PathLike, bytes]]): pairs of path / key and data to be written
+            max_concurrency (int, optional): maximum number of concurrent requests. Defaults to 64.
+        """
+    def put_multipart(self, location: PathLike, bytes: bytes, part_size: int = 10485760) -> None:
+        """Save the provided bytes to the specified location using a multipart upload.
+
+        The data is uploaded in parts of `part_size` bytes, only the last part may be smaller.
+        Parts are uploaded concurrently.
+
+        Args:
+            location (PathLike): path / key to storage location
+            bytes (bytes): data to be written to location
+            part_size (int, optional): size of the uploaded parts in bytes, at least 5 MiB. Defaults to 10 MiB.
+        """
+    def list(self, prefix: PathLike | None = None, max_keys: int | None = None) -> list[ObjectMeta]:
         """List all the objects with the given prefix.
 
         Prefixes are evaluated on a path segment basis, i.e. `foo/bar/` is a prefix
-        of `foo/bar/x` but not of `foo/bar_baz/x`.
+        of `foo/bar/x` but not of `foo/bar_baz/x`. A trailing delimiter is implied,
+        so `foo/bar` and `foo/bar/` list the same objects.
+
+        Args:
+            prefix (PathLike | None, optional): path prefix to filter limit list results. Defaults to None.
+            max_keys (int | None, optional): maximum number of objects to return. Defaults to None.
+
+        Returns:
+            list[ObjectMeta]: ObjectMeta for all objects under the listed path
+        """
+    def iter_list(self, prefix: PathLike | None = None, max_keys: int | None = None) -> ListIterator:
+        """Iterate over all the objects with the given prefix.
+
+        Objects are listed in the background while the iterator is consumed, so the first
+        results are available before the full listing completes.
+
+        The listing does not count against `max_in_flight`, so other requests can be issued
+        to this store while iterating.
+
+        Args:
+            prefix (PathLike | None, optional): path prefix to filter limit list results. Defaults to None.
+            max_keys (int | None, optional): maximum number of objects to return. Defaults to None.
+
+        Returns:
+            ListIterator: iterator over ObjectMeta for all objects under the listed path
         """
-    def head(self, location: Path) -> ObjectMeta:
-        """Return the metadata for the specified location"""
-    def list_with_delimiter(self, prefix: Path | None) -> ListResult:
+    def head(self, location: PathLike) -> ObjectMeta:
+        """Return the metadata for the specified location.
+
+        Args:
+            location (PathLike): path / key to storage location
+
+        Returns:
+            ObjectMeta: metadata for object at location
+        """
+    def list_with_delimiter(self, prefix: PathLike | None = None) -> ListResult:
         """List objects with the given prefix and an implementation specific
         delimiter. Returns common prefixes (directories) in addition to object
         metadata.
 
         Prefixes are evaluated on a path segment basis, i.e. `foo/bar/` is a prefix
-        of `foo/bar/x` but not of `foo/bar_baz/x`.
+        of `foo/bar/x` but not of `foo/bar_baz/x`. A trailing delimiter is implied,
+        so `foo/bar` and `foo/bar/` list the same objects.
+
+        Args:
+            prefix (PathLike | None, optional): path prefix to filter limit list results. Defaults to None.
+
+        Returns:
+            ListResult: common prefixes and ObjectMeta for all objects directly under the listed path
+        """
+    def list_prefixes(self, prefix: PathLike | None = None) -> list[Path]:
+        """List the common prefixes (directories) directly below the given prefix.
+
+        Unlike `list_with_delimiter`, no metadata for the listed objects is returned.
+
+        Args:
+            prefix (PathLike | None, optional): path prefix to filter limit list results. Defaults to None.
+
+        Returns:
+            list[Path]: common prefixes directly under the listed path
+        """
+    def head_many(self, locations: list[PathLike], max_concurrency: int = 64) -> list[ObjectMeta]:
+        """Return the metadata for each of the specified locations.
+
+        All requests are issued concurrently, with at most `max_concurrency` requests in flight.
+
+        Args:
+            locations (list[PathLike]): paths / keys to storage locations
+            max_concurrency (int, optional): maximum number of concurrent requests. Defaults to 64.
+
+        Returns:
+            list[ObjectMeta]: metadata for the object at each location, in the order of `locations`
+        """
+    def delete(self, location: PathLike) -> None:
+        """Delete the object at the specified location.
+
+        Args:
+            location (PathLike): path / key to storage location
+        """
+    def delete_many(self, locations: list[PathLike], max_concurrency: int = 64) -> None:
+        """Delete the objects at the specified locations.
+
+        All requests are issued concurrently, with at most `max_concurrency` requests in flight.
+
+        Args:
+            locations (list[PathLike]): paths / keys to storage locations
+            max_concurrency (int, optional): maximum number of concurrent requests. Defaults to 64.
         """
-    def delete(self, location: Path) -> None:
-        """Delete the object at the specified location."""
-    def copy(self, src: Path, dst: Path) -> None:
+    def copy(self, src: PathLike, dst: PathLike) -> None:
         """Copy an object from one path to another in the same object store.
 
         If there exists an object at the destination, it will be overwritten.
+
+        Args:
+            src (PathLike): source path
+            dst (PathLike): destination path
         """
-    def copy_if_not_exists(self, src: Path, dst: Path) -> None:
+    def copy_if_not_exists(self, src: PathLike, dst: PathLike) -> None:
         """Copy an object from one path to another, only if destination is empty.
 
         Will return an error if the destination already has an object.
+
+        Args:
+            src (PathLike): source path
+            dst (PathLike): destination path
         """
-    def rename(self, src: Path, dst: Path) -> None:
+    def rename(self, src: PathLike, dst: PathLike) -> None:
         """Move an object from one path to another in the same object store.
 
         By default, this is implemented as a copy and then delete source. It may not
         check when deleting source that it was the same object that was originally copied.
 
         If there exists an object at the destination, it will be overwritten.
+
+        Args:
+            src (PathLike): source path
+            dst (PathLike): destination path
         """
-    def rename_if_not_exists(self, src: Path, dst: Path) -> None:
+    def rename_if_not_exists(self, src: PathLike, dst: PathLike) -> None:
         """Move an object from one path to another in the same object store.
 
         Will return an error if the destination already has an object.
+
+        Args:
+            src (PathLike): source path
+            dst (PathLike): destination path
         """
 
 class ObjectInputFile:
@@ -115,7 +314,21 @@ class ObjectOutputStream:
 class ArrowFileSystemHandler:
     """Implementation of pyarrow.fs.FileSystemHandler for use with pyarrow.fs.PyFileSystem"""
 
-    def __init__(self, root: str, options: dict[str, str] | None = None) -> None: ...
+    def __init__(
+        self,
+        root: str,
+        options: dict[str, str] | None = None,
+        write_batch_size: int = 1048576,
+        store: ObjectStore | None = None,
+    ) -> None:
+        """Create a new handler.
+
+        Output streams buffer up to `write_batch_size` bytes before writing to the store.
+        If `store` is given, the handler shares its connections instead of creating a new
+        store. `root` and `options` (if given) must then match the ones of `store`. Open
+        files keep a request in flight until they are closed, so the handler is not subject
+        to the `max_in_flight` limit of `store`.
+        """
     def copy_file(self, src: str, dst: str) -> None:
         """Copy a file.
 
@@ -1,6 +1,7 @@
 import pyarrow as pa
 import pyarrow.fs as fs
 
+from . import ObjectStore
 from ._internal import ArrowFileSystemHandler as _ArrowFileSystemHandler
 
 
@@ -8,11 +9,20 @@ from ._internal import ArrowFileSystemHandler as _ArrowFileSystemHandler
 # _ArrowFileSystemHandler mus be the first element in the inherited classes, we need to also
 # inherit form fs.FileSystemHandler to pass pyarrow's type checks.
 class ArrowFileSystemHandler(_ArrowFileSystemHandler, fs.FileSystemHandler):
+    @classmethod
+    def for_url(cls, root: str, options: dict[str, str] | None = None) -> "ArrowFileSystemHandler":
+        """Create a handler backed by the shared store returned by `ObjectStore.get_or_create`."""
+        store = ObjectStore.get_or_create(root, options)
+        handler = cls(root, options, store=store)
+        # keep the store alive, so it is shared with later calls for the same root and options
+        handler._store = store
+        return handler
+
     def open_input_file(self, path: str) -> pa.PythonFile:
         return pa.PythonFile(_ArrowFileSystemHandler.open_input_file(self, path))
 
-    def open_input_stream(self, path: str) -> pa.PythonFile:
-        return pa.PythonFile(_ArrowFileSystemHandler.open_input_file(self, path))
+    # object store files support random access, so streams can use the same implementation
+    open_input_stream = open_input_file
 
     def open_output_stream(self, path: str, metadata: dict[str, str] | None = None) -> pa.PythonFile:
         return pa.PythonFile(_ArrowFileSystemHandler.open_output_stream(self, path, metadata))
@@ -21,3 +31,6 @@ class ArrowFileSystemHandler(_ArrowFileSystemHandler, fs.FileSystemHandler):
         return _ArrowFileSystemHandler.get_file_info_selector(
             self, selector.base_dir, selector.allow_not_found, selector.recursive
         )
+
+    def move(self, src: str, dest: str) -> None:
+        return _ArrowFileSystemHandler.move_file(self, src, dest)
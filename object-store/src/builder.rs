@@ -1,17 +1,24 @@
 use std::collections::HashMap;
+use std::fmt;
+use std::ops::Range;
 use std::sync::Arc;
 
+use async_trait::async_trait;
+use bytes::Bytes;
+use futures::stream::BoxStream;
 use object_store::aws::{AmazonS3, AmazonS3Builder};
 use object_store::azure::{MicrosoftAzure, MicrosoftAzureBuilder};
 use object_store::gcp::{GoogleCloudStorage, GoogleCloudStorageBuilder};
+use object_store::limit::LimitStore;
 use object_store::local::LocalFileSystem;
 use object_store::memory::InMemory;
 use object_store::path::Path;
 use object_store::prefix::PrefixObjectStore;
 use object_store::{
-    ClientOptions, DynObjectStore, Error as ObjectStoreError, Result as ObjectStoreResult,
-    RetryConfig,
+    ClientOptions, DynObjectStore, Error as ObjectStoreError, GetResult, ListResult, MultipartId,
+    ObjectMeta, ObjectStore, Result as ObjectStoreResult, RetryConfig,
 };
+use tokio::io::AsyncWrite;
 use url::Url;
 
 enum ObjectStoreKind {
@@ -77,6 +84,92 @@ impl ObjectStoreImpl {
     }
 }
 
+/// Forwards all requests to a store that may also be used directly, so it can be
+/// wrapped by other stores without giving up ownership.
+#[derive(Debug)]
+struct SharedStore(Arc<DynObjectStore>);
+
+impl fmt::Display for SharedStore {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        write!(f, "{}", self.0)
+    }
+}
+
+#[async_trait]
+impl ObjectStore for SharedStore {
+    async fn put(&self, location: &Path, bytes: Bytes) -> ObjectStoreResult<()> {
+        self.0.put(location, bytes).await
+    }
+
+    async fn put_multipart(
+        &self,
+        location: &Path,
+    ) -> ObjectStoreResult<(MultipartId, Box<dyn AsyncWrite + Unpin + Send>)> {
+        self.0.put_multipart(location).await
+    }
+
+    async fn abort_multipart(
+        &self,
+        location: &Path,
+        multipart_id: &MultipartId,
+    ) -> ObjectStoreResult<()> {
+        self.0.abort_multipart(location, multipart_id).await
+    }
+
+    async fn get(&self, location: &Path) -> ObjectStoreResult<GetResult> {
+        self.0.get(location).await
+    }
+
+    async fn get_range(&self, location: &Path, range: Range<usize>) -> ObjectStoreResult<Bytes> {
+        self.0.get_range(location, range).await
+    }
+
+    async fn head(&self, location: &Path) -> ObjectStoreResult<ObjectMeta> {
+        self.0.head(location).await
+    }
+
+    async fn delete(&self, location: &Path) -> ObjectStoreResult<()> {
+        self.0.delete(location).await
+    }
+
+    async fn list(
+        &self,
+        prefix: Option<&Path>,
+    ) -> ObjectStoreResult<BoxStream<'_, ObjectStoreResult<ObjectMeta>>> {
+        self.0.list(prefix).await
+    }
+
+    async fn list_with_delimiter(&self, prefix: Option<&Path>) -> ObjectStoreResult<ListResult> {
+        self.0.list_with_delimiter(prefix).await
+    }
+
+    async fn copy(&self, from: &Path, to: &Path) -> ObjectStoreResult<()> {
+        self.0.copy(from, to).await
+    }
+
+    async fn rename(&self, from: &Path, to: &Path) -> ObjectStoreResult<()> {
+        self.0.rename(from, to).await
+    }
+
+    async fn copy_if_not_exists(&self, from: &Path, to: &Path) -> ObjectStoreResult<()> {
+        self.0.copy_if_not_exists(from, to).await
+    }
+
+    async fn rename_if_not_exists(&self, from: &Path, to: &Path) -> ObjectStoreResult<()> {
+        self.0.rename_if_not_exists(from, to).await
+    }
+}
+
+/// Wrap a store such that at most `max_in_flight` requests are issued concurrently, if given.
+///
+/// The wrapped store can still be used directly, bypassing the limit.
+pub fn with_limit(store: Arc<DynObjectStore>, max_in_flight: Option<usize>) -> Arc<DynObjectStore> {
+    match max_in_flight {
+        Some(max_requests) => Arc::new(LimitStore::new(SharedStore(store), max_requests)),
+        None => store,
+    }
+}
+
 #[derive(Debug, Clone)]
 pub struct ObjectStoreBuilder {
     url: String,
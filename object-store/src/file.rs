@@ -2,8 +2,10 @@ use std::collections::HashMap;
 use std::sync::Arc;
 
 use crate::builder::ObjectStoreBuilder;
-use crate::utils::{delete_dir, walk_tree};
-use crate::ObjectStoreError;
+use crate::utils::{
+    delete_dir, file_status_many, get_range, walk_tree, FileStatus, DEFAULT_MAX_CONCURRENCY,
+};
+use crate::{ObjectStoreError, PyObjectStore};
 
 use object_store::path::Path;
 use object_store::{DynObjectStore, Error as InnerObjectStoreError, ListResult, MultipartId};
@@ -13,6 +15,9 @@ use pyo3::types::{IntoPyDict, PyBytes};
 use tokio::io::{AsyncWrite, AsyncWriteExt};
 use tokio::runtime::Runtime;
 
+/// Default number of bytes an output stream buffers before writing to the store
+const DEFAULT_WRITE_BATCH_SIZE: usize = 1024 * 1024;
+
 #[pyclass(subclass, weakref)]
 #[derive(Debug, Clone)]
 pub struct ArrowFileSystemHandler {
@@ -20,13 +25,43 @@ pub struct ArrowFileSystemHandler {
     rt: Arc<Runtime>,
     root_url: String,
     options: Option<HashMap<String, String>>,
+    write_batch_size: usize,
 }
 
 #[pymethods]
 impl ArrowFileSystemHandler {
     #[new]
-    #[args(options = "None")]
-    fn new(root: String, options: Option<HashMap<String, String>>) -> PyResult<Self> {
+    #[args(
+        options = "None",
+        write_batch_size = "DEFAULT_WRITE_BATCH_SIZE",
+        store = "None"
+    )]
+    fn new(
+        root: String,
+        options: Option<HashMap<String, String>>,
+        write_batch_size: usize,
+        store: Option<PyRef<PyObjectStore>>,
+    ) -> PyResult<Self> {
+        // share connections and credentials with an existing store, if given
+        if let Some(store) = store {
+            let options_match = options.as_ref().map_or(true, |options| {
+                *options == store.options.clone().unwrap_or_default()
+            });
+            if root != store.root_url || !options_match {
+                return Err(PyValueError::new_err(
+                    "'root' and 'options' must match the ones of 'store'.",
+                ));
+            }
+            return Ok(Self {
+                root_url: store.root_url.clone(),
+                // open files keep a request slot until they are dropped, so they must not
+                // wait for the store's limit while python holds on to other open files
+                inner: store.unlimited.clone(),
+                rt: store.rt.clone(),
+                options: store.options.clone(),
+                write_batch_size,
+            });
+        }
         let inner = ObjectStoreBuilder::new(root.clone())
             .with_path_as_prefix(true)
             .with_options(options.clone().unwrap_or_default())
@@ -37,6 +72,7 @@ impl ArrowFileSystemHandler {
             inner,
             rt: Arc::new(Runtime::new()?),
             options,
+            write_batch_size,
         })
     }
 
@@ -91,50 +127,43 @@ impl ArrowFileSystemHandler {
             fs.call_method("FileInfo", (loc, type_), Some(kwargs.into_py_dict(py)))
         };
 
-        let mut infos = Vec::new();
-        for file_path in paths {
-            let path = Path::from(file_path);
-            let listed = self
-                .rt
-                .block_on(self.inner.list_with_delimiter(Some(&path)))
-                .map_err(ObjectStoreError::from)?;
-
-            // TODO is there a better way to figure out if we are in a directory?
-            if listed.objects.is_empty() && listed.common_prefixes.is_empty() {
-                let maybe_meta = self.rt.block_on(self.inner.head(&path));
-                match maybe_meta {
-                    Ok(meta) => {
-                        let kwargs = HashMap::from([
-                            ("size", meta.size as i64),
-                            ("mtime_ns", meta.last_modified.timestamp_nanos()),
-                        ]);
-                        infos.push(to_file_info(
-                            meta.location.to_string(),
-                            file_types.getattr("File")?,
-                            kwargs,
-                        )?);
-                    }
-                    Err(object_store::Error::NotFound { .. }) => {
-                        infos.push(to_file_info(
-                            path.to_string(),
-                            file_types.getattr("NotFound")?,
-                            HashMap::new(),
-                        )?);
-                    }
-                    Err(err) => {
-                        return Err(ObjectStoreError::from(err).into());
-                    }
+        let paths = paths.into_iter().map(Path::from).collect::<Vec<_>>();
+        let statuses = self
+            .rt
+            .block_on(file_status_many(
+                self.inner.as_ref(),
+                &paths,
+                DEFAULT_MAX_CONCURRENCY,
+            ))
+            .map_err(ObjectStoreError::from)?;
+
+        paths
+            .into_iter()
+            .zip(statuses)
+            .map(|(path, status)| match status {
+                FileStatus::File(meta) => {
+                    let kwargs = HashMap::from([
+                        ("size", meta.size as i64),
+                        ("mtime_ns", meta.last_modified.timestamp_nanos()),
+                    ]);
+                    to_file_info(
+                        meta.location.to_string(),
+                        file_types.getattr("File")?,
+                        kwargs,
+                    )
                 }
-            } else {
-                infos.push(to_file_info(
+                FileStatus::Directory => to_file_info(
                     path.to_string(),
                     file_types.getattr("Directory")?,
                     HashMap::new(),
-                )?);
-            }
-        }
-
-        Ok(infos)
+                ),
+                FileStatus::NotFound => to_file_info(
+                    path.to_string(),
+                    file_types.getattr("NotFound")?,
+                    HashMap::new(),
+                ),
+            })
+            .collect()
     }
 
     #[args(allow_not_found = "false", recursive = "false")]
@@ -243,13 +272,18 @@ impl ArrowFileSystemHandler {
                 self.rt.clone(),
                 self.inner.clone(),
                 path,
+                self.write_batch_size,
             ))
             .map_err(ObjectStoreError::from)?;
         Ok(file)
     }
 
-    pub fn __getnewargs__(&self) -> PyResult<(String, Option<HashMap<String, String>>)> {
-        Ok((self.root_url.clone(), self.options.clone()))
+    pub fn __getnewargs__(&self) -> PyResult<(String, Option<HashMap<String, String>>, usize)> {
+        Ok((
+            self.root_url.clone(),
+            self.options.clone(),
+            self.write_batch_size,
+        ))
     }
 }
 
@@ -379,7 +413,7 @@ impl ObjectInputFile {
     }
 
     #[args(nbytes = "None")]
-    fn read(&mut self, nbytes: Option<i64>) -> PyResult<Py<PyBytes>> {
+    fn read(&mut self, nbytes: Option<i64>, py: Python<'_>) -> PyResult<Py<PyBytes>> {
         self.check_closed()?;
         let range = match nbytes {
             Some(len) => {
@@ -394,17 +428,14 @@ impl ObjectInputFile {
                 end: self.content_length as usize,
             },
         };
-        let nbytes = (range.end - range.start) as i64;
-        self.pos += nbytes;
-        let obj = if nbytes > 0 {
-            self.rt
-                .block_on(self.store.get_range(&self.path, range))
-                .map_err(ObjectStoreError::from)?
-                .to_vec()
-        } else {
-            Vec::new()
-        };
-        Python::with_gil(|py| Ok(PyBytes::new(py, &obj).into_py(py)))
+        // release the GIL while waiting for the store, so that pyarrow can
+        // read from other files on its I/O threads in the meantime.
+        let (rt, store, path) = (&self.rt, &self.store, &self.path);
+        let obj = py
+            .allow_threads(|| rt.block_on(get_range(store.as_ref(), path, range)))
+            .map_err(ObjectStoreError::from)?;
+        self.pos += obj.len() as i64;
+        Ok(PyBytes::new(py, &obj).into_py(py))
     }
 
     fn fileno(&self) -> PyResult<()> {
@@ -435,6 +466,8 @@ pub struct ObjectOutputStream {
     path: Path,
     writer: Box<dyn AsyncWrite + Send + Unpin>,
     multipart_id: MultipartId,
+    buffer: Vec<u8>,
+    write_batch_size: usize,
     pos: i64,
     #[pyo3(get)]
     closed: bool,
@@ -447,6 +480,7 @@ impl ObjectOutputStream {
         rt: Arc<Runtime>,
         store: Arc<DynObjectStore>,
         path: Path,
+        write_batch_size: usize,
     ) -> Result<Self, ObjectStoreError> {
         let (multipart_id, writer) = store.put_multipart(&path).await.unwrap();
         Ok(Self {
@@ -455,6 +489,8 @@ impl ObjectOutputStream {
             path,
             writer,
             multipart_id,
+            buffer: Vec::with_capacity(write_batch_size),
+            write_batch_size,
             pos: 0,
             closed: false,
             mode: "wb".into(),
@@ -470,20 +506,43 @@ impl ObjectOutputStream {
 
         Ok(())
     }
+
+    /// Write all buffered data to the underlying writer, aborting the upload on failure.
+    fn write_buffer(&mut self, py: Python<'_>) -> PyResult<()> {
+        if self.buffer.is_empty() {
+            return Ok(());
+        }
+        let (rt, writer, buffer) = (&self.rt, &mut self.writer, &self.buffer);
+        let written = py.allow_threads(|| rt.block_on(writer.write_all(buffer)));
+        match written {
+            Ok(_) => {
+                self.buffer.clear();
+                Ok(())
+            }
+            Err(err) => self.abort(err),
+        }
+    }
+
+    /// Abort the upload after a failed write and close the stream.
+    fn abort(&mut self, err: std::io::Error) -> PyResult<()> {
+        // drop the writer first, it may hold a request slot the abort has to wait for
+        self.writer = Box::new(tokio::io::sink());
+        self.closed = true;
+        self.rt
+            .block_on(self.store.abort_multipart(&self.path, &self.multipart_id))
+            .map_err(ObjectStoreError::from)?;
+        Err(ObjectStoreError::from(err).into())
+    }
 }
 
 #[pymethods]
 impl ObjectOutputStream {
-    fn close(&mut self) -> PyResult<()> {
+    fn close(&mut self, py: Python<'_>) -> PyResult<()> {
+        self.write_buffer(py)?;
         self.closed = true;
         match self.rt.block_on(self.writer.shutdown()) {
             Ok(_) => Ok(()),
-            Err(err) => {
-                self.rt
-                    .block_on(self.store.abort_multipart(&self.path, &self.multipart_id))
-                    .map_err(ObjectStoreError::from)?;
-                Err(ObjectStoreError::from(err).into())
-            }
+            Err(err) => self.abort(err),
         }
     }
 
@@ -525,29 +584,26 @@ impl ObjectOutputStream {
         Err(PyNotImplementedError::new_err("'read' not implemented"))
     }
 
-    fn write(&mut self, data: Vec<u8>) -> PyResult<i64> {
+    /// Write data to the stream.
+    ///
+    /// Small writes are collected until `write_batch_size` bytes are buffered, so that
+    /// the underlying writer is driven once per batch rather than once per call.
+    fn write(&mut self, data: Vec<u8>, py: Python<'_>) -> PyResult<i64> {
         self.check_closed()?;
         let len = data.len() as i64;
-        match self.rt.block_on(self.writer.write_all(&data)) {
-            Ok(_) => Ok(len),
-            Err(err) => {
-                self.rt
-                    .block_on(self.store.abort_multipart(&self.path, &self.multipart_id))
-                    .map_err(ObjectStoreError::from)?;
-                Err(ObjectStoreError::from(err).into())
-            }
+        self.buffer.extend_from_slice(&data);
+        if self.buffer.len() >= self.write_batch_size {
+            self.write_buffer(py)?;
         }
+        self.pos += len;
+        Ok(len)
     }
 
-    fn flush(&mut self) -> PyResult<()> {
+    fn flush(&mut self, py: Python<'_>) -> PyResult<()> {
+        self.write_buffer(py)?;
         match self.rt.block_on(self.writer.flush()) {
             Ok(_) => Ok(()),
-            Err(err) => {
-                self.rt
-                    .block_on(self.store.abort_multipart(&self.path, &self.multipart_id))
-                    .map_err(ObjectStoreError::from)?;
-                Err(ObjectStoreError::from(err).into())
-            }
+            Err(err) => self.abort(err),
         }
     }
 
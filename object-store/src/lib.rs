@@ -2,24 +2,44 @@ mod builder;
 mod file;
 mod utils;
 
+use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
 use std::fmt;
+use std::hash::{Hash, Hasher};
 use std::sync::Arc;
 
+use crate::builder::with_limit;
 use crate::file::{ArrowFileSystemHandler, ObjectInputFile, ObjectOutputStream};
-use crate::utils::{flatten_list_stream, get_bytes};
+use crate::utils::{
+    delete_many, flatten_list_stream, get_bytes, get_many, get_range, get_ranges, head_many,
+    put_many, send_list_stream, send_ranges, DEFAULT_MAX_CONCURRENCY, LIST_BUFFER_SIZE,
+};
 
-use object_store::path::{Error as PathError, Path};
-use object_store::{DynObjectStore, Error as InnerObjectStoreError, ListResult, ObjectMeta};
+use bytes::Bytes;
+use object_store::path::{Error as PathError, Path, DELIMITER};
+use object_store::{
+    DynObjectStore, Error as InnerObjectStoreError, ListResult, ObjectMeta,
+    Result as InnerObjectStoreResult,
+};
+use once_cell::sync::OnceCell;
 use pyo3::exceptions::{
-    PyException, PyFileExistsError, PyFileNotFoundError, PyNotImplementedError,
+    PyException, PyFileExistsError, PyFileNotFoundError, PyNotImplementedError, PyValueError,
 };
 use pyo3::prelude::*;
-use pyo3::{types::PyBytes, PyErr};
+use pyo3::types::{PyBytes, PyList, PyString};
+use pyo3::PyErr;
+use tokio::io::AsyncWriteExt;
 use tokio::runtime::Runtime;
+use tokio::sync::mpsc;
 
 pub use builder::ObjectStoreBuilder;
 
+/// Default size of the parts of a multipart upload
+const DEFAULT_PART_SIZE: usize = 10 * 1024 * 1024;
+
+/// Smallest supported part size; smaller writes are buffered into larger parts by the upload
+const MIN_PART_SIZE: usize = 5 * 1024 * 1024;
+
 #[derive(Debug)]
 pub enum ObjectStoreError {
     ObjectStore(InnerObjectStoreError),
@@ -93,40 +113,92 @@ impl From<ObjectStoreError> for PyErr {
 
 #[pyclass(name = "Path", subclass)]
 #[derive(Clone)]
-struct PyPath(Path);
+struct PyPath {
+    path: Path,
+    // paths are immutable, so the hash can be computed once and reused
+    hash: OnceCell<u64>,
+}
+
+impl PyPath {
+    fn hash_value(&self) -> u64 {
+        *self.hash.get_or_init(|| {
+            let mut hasher = DefaultHasher::new();
+            self.path.as_ref().hash(&mut hasher);
+            hasher.finish()
+        })
+    }
+
+    fn equals(&self, other: &PyPath) -> bool {
+        // only compare hashes if both are already known, computing them is as expensive as
+        // comparing the paths directly.
+        match (self.hash.get(), other.hash.get()) {
+            (Some(hash), Some(other_hash)) if hash != other_hash => false,
+            _ => self.path == other.path,
+        }
+    }
+}
 
 impl From<PyPath> for Path {
     fn from(path: PyPath) -> Self {
-        path.0
+        path.path
     }
 }
 
 impl From<Path> for PyPath {
     fn from(path: Path) -> Self {
-        Self(path)
+        Self {
+            path,
+            hash: OnceCell::new(),
+        }
     }
 }
 
+/// Convert a python path-like object (`Path`, `str` or `list[str]`) into a [`Path`]
+fn to_path(raw: &PyAny) -> PyResult<Path> {
+    if let Ok(raw) = raw.downcast::<PyString>() {
+        return Ok(Path::parse(raw.to_str()?).map_err(ObjectStoreError::from)?);
+    }
+    if let Ok(parts) = raw.downcast::<PyList>() {
+        let parts = parts.extract::<Vec<&str>>()?;
+        return Ok(Path::parse(parts.join(DELIMITER)).map_err(ObjectStoreError::from)?);
+    }
+    if let Ok(path) = raw.extract::<PyRef<PyPath>>() {
+        return Ok(path.path.clone());
+    }
+    Err(PyValueError::new_err(format!(
+        "Cannot convert type '{}' to type Path.",
+        raw.get_type().name()?
+    )))
+}
+
 #[pymethods]
 impl PyPath {
     #[new]
-    fn new(path: String) -> PyResult<Self> {
-        Ok(Self(Path::parse(path).map_err(ObjectStoreError::from)?))
+    fn new(path: &PyAny) -> PyResult<Self> {
+        Ok(to_path(path)?.into())
     }
 
     /// Creates a new child of this [`Path`]
     fn child(&self, part: String) -> Self {
-        Self(self.0.child(part))
+        self.path.child(part).into()
     }
 
     fn __str__(&self) -> String {
-        self.0.to_string()
+        self.path.to_string()
+    }
+
+    fn __hash__(&self) -> isize {
+        match self.hash_value() as isize {
+            // -1 is reserved to signal errors in the python C API
+            -1 => -2,
+            hash => hash,
+        }
     }
 
-    fn __richcmp__(&self, other: PyPath, cmp: pyo3::basic::CompareOp) -> PyResult<bool> {
+    fn __richcmp__(&self, other: PyRef<PyPath>, cmp: pyo3::basic::CompareOp) -> PyResult<bool> {
         match cmp {
-            pyo3::basic::CompareOp::Eq => Ok(self.0 == other.0),
-            pyo3::basic::CompareOp::Ne => Ok(self.0 != other.0),
+            pyo3::basic::CompareOp::Eq => Ok(self.equals(&other)),
+            pyo3::basic::CompareOp::Ne => Ok(!self.equals(&other)),
             _ => Err(PyNotImplementedError::new_err(
                 "Only == and != are supported.",
             )),
@@ -212,85 +284,349 @@ impl From<ListResult> for PyListResult {
     }
 }
 
+#[pyclass(name = "ListIterator")]
+/// Iterator over listed objects, which are fetched in the background while iterating.
+struct PyListIterator {
+    rx: mpsc::Receiver<InnerObjectStoreResult<ObjectMeta>>,
+    // the listing task runs on this runtime, so it must outlive the iterator
+    #[allow(unused)]
+    rt: Arc<Runtime>,
+}
+
+#[pymethods]
+impl PyListIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<PyObjectMeta>> {
+        let py = slf.py();
+        let rx = &mut slf.rx;
+        match py.allow_threads(|| rx.blocking_recv()) {
+            Some(meta) => Ok(Some(meta.map_err(ObjectStoreError::from)?.into())),
+            None => Ok(None),
+        }
+    }
+}
+
+#[pyclass(name = "RangeIterator")]
+/// Iterator over `(index, bytes)` pairs of requested byte ranges, yielded as soon as
+/// each range has been fetched.
+struct PyRangeIterator {
+    rx: mpsc::Receiver<InnerObjectStoreResult<(usize, Bytes)>>,
+    // the fetching task runs on this runtime, so it must outlive the iterator
+    #[allow(unused)]
+    rt: Arc<Runtime>,
+}
+
+#[pymethods]
+impl PyRangeIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<(usize, Py<PyBytes>)>> {
+        let py = slf.py();
+        let rx = &mut slf.rx;
+        match py.allow_threads(|| rx.blocking_recv()) {
+            Some(item) => {
+                let (idx, bytes) = item.map_err(ObjectStoreError::from)?;
+                Ok(Some((idx, PyBytes::new(py, &bytes).into_py(py))))
+            }
+            None => Ok(None),
+        }
+    }
+}
+
+/// Convert `(start, length)` tuples into byte ranges
+fn to_ranges(ranges: Vec<(usize, usize)>) -> Vec<std::ops::Range<usize>> {
+    ranges
+        .into_iter()
+        .map(|(start, length)| std::ops::Range {
+            start,
+            end: start + length,
+        })
+        .collect()
+}
+
 #[pyclass(name = "ObjectStore", subclass)]
 #[derive(Debug, Clone)]
 /// A generic object store interface for uniformly interacting with AWS S3, Google Cloud Storage,
 /// Azure Blob Storage and local files.
 struct PyObjectStore {
     inner: Arc<DynObjectStore>,
+    // the same store without the limit on concurrent requests, for consumers that
+    // hold on to a request while returning control to python, e.g. open files
+    unlimited: Arc<DynObjectStore>,
     rt: Arc<Runtime>,
     root_url: String,
     options: Option<HashMap<String, String>>,
+    max_in_flight: Option<usize>,
 }
 
 #[pymethods]
 impl PyObjectStore {
     #[new]
-    #[args(options = "None")]
+    #[args(options = "None", max_in_flight = "Some(DEFAULT_MAX_CONCURRENCY)")]
     /// Create a new ObjectStore instance
-    fn new(root: String, options: Option<HashMap<String, String>>) -> PyResult<Self> {
-        let inner = ObjectStoreBuilder::new(root.clone())
+    ///
+    /// At most `max_in_flight` requests are issued concurrently, across all operations
+    /// on this instance. Pass `None` to disable the limit.
+    fn new(
+        root: String,
+        options: Option<HashMap<String, String>>,
+        max_in_flight: Option<usize>,
+    ) -> PyResult<Self> {
+        if max_in_flight == Some(0) {
+            return Err(PyValueError::new_err("'max_in_flight' must be positive."));
+        }
+        let unlimited = ObjectStoreBuilder::new(root.clone())
             .with_path_as_prefix(true)
             .with_options(options.clone().unwrap_or_default())
             .build()
             .map_err(ObjectStoreError::from)?;
         Ok(Self {
             root_url: root,
-            inner,
+            inner: with_limit(unlimited.clone(), max_in_flight),
+            unlimited,
             rt: Arc::new(Runtime::new()?),
             options,
+            max_in_flight,
         })
     }
 
     /// Save the provided bytes to the specified location.
     #[pyo3(text_signature = "($self, location, bytes)")]
-    fn put(&self, location: PyPath, bytes: Vec<u8>) -> PyResult<()> {
+    fn put(&self, location: &PyAny, bytes: Vec<u8>) -> PyResult<()> {
         self.rt
-            .block_on(self.inner.put(&location.into(), bytes.into()))
+            .block_on(self.inner.put(&to_path(location)?, bytes.into()))
             .map_err(ObjectStoreError::from)?;
         Ok(())
     }
 
+    /// Save the provided bytes to the specified locations.
+    ///
+    /// All objects are uploaded concurrently, with at most `max_concurrency` requests in flight.
+    #[pyo3(text_signature = "($self, items, max_concurrency)")]
+    #[args(max_concurrency = "DEFAULT_MAX_CONCURRENCY")]
+    fn put_many(&self, items: Vec<(&PyAny, &[u8])>, max_concurrency: usize) -> PyResult<()> {
+        let items = items
+            .into_iter()
+            .map(|(location, bytes)| Ok((to_path(location)?, Bytes::copy_from_slice(bytes))))
+            .collect::<PyResult<Vec<_>>>()?;
+        self.rt
+            .block_on(put_many(self.inner.as_ref(), items, max_concurrency))
+            .map_err(ObjectStoreError::from)?;
+        Ok(())
+    }
+
+    /// Save the provided bytes to the specified location using a multipart upload.
+    ///
+    /// The data is uploaded in parts of `part_size` bytes, only the last part may be
+    /// smaller. `part_size` must be at least 5 MiB, the smallest part size supported
+    /// by all backends. Parts are uploaded concurrently.
+    #[pyo3(text_signature = "($self, location, bytes, part_size)")]
+    #[args(part_size = "DEFAULT_PART_SIZE")]
+    fn put_multipart(
+        &self,
+        location: &PyAny,
+        bytes: &[u8],
+        part_size: usize,
+        py: Python,
+    ) -> PyResult<()> {
+        if part_size < MIN_PART_SIZE {
+            return Err(PyValueError::new_err(format!(
+                "'part_size' must be at least {} bytes.",
+                MIN_PART_SIZE
+            )));
+        }
+        let path = to_path(location)?;
+        py.allow_threads(|| {
+            self.rt.block_on(async {
+                let (multipart_id, mut writer) = self.inner.put_multipart(&path).await?;
+                // the writer is consumed, so any request slot it holds is released before
+                // the upload is aborted
+                let written = async move {
+                    for part in bytes.chunks(part_size) {
+                        writer.write_all(part).await?;
+                    }
+                    writer.shutdown().await
+                }
+                .await;
+                if let Err(err) = written {
+                    self.inner.abort_multipart(&path, &multipart_id).await?;
+                    return Err(ObjectStoreError::from(err));
+                }
+                Ok::<_, ObjectStoreError>(())
+            })
+        })?;
+        Ok(())
+    }
+
     /// Return the bytes that are stored at the specified location.
     #[pyo3(text_signature = "($self, location)")]
-    fn get(&self, location: PyPath) -> PyResult<Py<PyBytes>> {
+    fn get(&self, location: &PyAny) -> PyResult<Py<PyBytes>> {
         let obj = self
             .rt
-            .block_on(get_bytes(self.inner.as_ref(), &location.into()))
+            .block_on(get_bytes(self.inner.as_ref(), &to_path(location)?))
             .map_err(ObjectStoreError::from)?;
         Python::with_gil(|py| Ok(PyBytes::new(py, &obj).into_py(py)))
     }
 
     /// Return the bytes that are stored at the specified location in the given byte range
     #[pyo3(text_signature = "($self, location, start, length)")]
-    fn get_range(&self, location: PyPath, start: usize, length: usize) -> PyResult<Py<PyBytes>> {
+    fn get_range(&self, location: &PyAny, start: usize, length: usize) -> PyResult<Py<PyBytes>> {
         let range = std::ops::Range {
             start,
             end: start + length,
         };
         let obj = self
             .rt
-            .block_on(self.inner.get_range(&location.into(), range))
-            .map_err(ObjectStoreError::from)?
-            .to_vec();
+            .block_on(get_range(self.inner.as_ref(), &to_path(location)?, range))
+            .map_err(ObjectStoreError::from)?;
         Python::with_gil(|py| Ok(PyBytes::new(py, &obj).into_py(py)))
     }
 
+    /// Return the bytes that are stored at each of the specified locations.
+    ///
+    /// All objects are requested concurrently, with at most `max_concurrency` requests in flight.
+    #[pyo3(text_signature = "($self, locations, max_concurrency)")]
+    #[args(max_concurrency = "DEFAULT_MAX_CONCURRENCY")]
+    fn get_many(
+        &self,
+        locations: Vec<&PyAny>,
+        max_concurrency: usize,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let paths = locations
+            .into_iter()
+            .map(to_path)
+            .collect::<PyResult<Vec<_>>>()?;
+        let objs = self
+            .rt
+            .block_on(get_many(self.inner.as_ref(), &paths, max_concurrency))
+            .map_err(ObjectStoreError::from)?;
+        Python::with_gil(|py| {
+            Ok(objs
+                .iter()
+                .map(|obj| PyBytes::new(py, obj).into_py(py))
+                .collect())
+        })
+    }
+
+    /// Return the bytes that are stored at the specified location in the given byte ranges.
+    ///
+    /// Ranges are given as `(start, length)` tuples. Nearby ranges are coalesced into
+    /// larger requests, which are issued concurrently.
+    #[pyo3(text_signature = "($self, location, ranges, max_concurrency)")]
+    #[args(max_concurrency = "DEFAULT_MAX_CONCURRENCY")]
+    fn get_ranges(
+        &self,
+        location: &PyAny,
+        ranges: Vec<(usize, usize)>,
+        max_concurrency: usize,
+    ) -> PyResult<Vec<Py<PyBytes>>> {
+        let ranges = to_ranges(ranges);
+        let objs = self
+            .rt
+            .block_on(get_ranges(
+                self.inner.as_ref(),
+                &to_path(location)?,
+                &ranges,
+                max_concurrency,
+            ))
+            .map_err(ObjectStoreError::from)?;
+        Python::with_gil(|py| {
+            Ok(objs
+                .iter()
+                .map(|obj| PyBytes::new(py, obj).into_py(py))
+                .collect())
+        })
+    }
+
+    /// Return an iterator over `(index, bytes)` for the given byte ranges, which yields
+    /// each range as soon as it has been fetched rather than in request order.
+    ///
+    /// Ranges are given as `(start, length)` tuples and `index` refers to the position
+    /// of a range in `ranges`.
+    #[pyo3(text_signature = "($self, location, ranges, max_concurrency)")]
+    #[args(max_concurrency = "DEFAULT_MAX_CONCURRENCY")]
+    fn get_ranges_stream(
+        &self,
+        location: &PyAny,
+        ranges: Vec<(usize, usize)>,
+        max_concurrency: usize,
+    ) -> PyResult<PyRangeIterator> {
+        let path = to_path(location)?;
+        let ranges = to_ranges(ranges);
+        // room for every range, so fetching never waits on the consumer
+        let (tx, rx) = mpsc::channel(ranges.len().max(1));
+        self.rt.spawn(send_ranges(
+            self.inner.clone(),
+            path,
+            ranges,
+            max_concurrency,
+            tx,
+        ));
+        Ok(PyRangeIterator {
+            rx,
+            rt: self.rt.clone(),
+        })
+    }
+
     /// Return the metadata for the specified location
     #[pyo3(text_signature = "($self, location)")]
-    fn head(&self, location: PyPath) -> PyResult<PyObjectMeta> {
+    fn head(&self, location: &PyAny) -> PyResult<PyObjectMeta> {
         let meta = self
             .rt
-            .block_on(self.inner.head(&location.into()))
+            .block_on(self.inner.head(&to_path(location)?))
             .map_err(ObjectStoreError::from)?;
         Ok(meta.into())
     }
 
+    /// Return the metadata for each of the specified locations.
+    ///
+    /// All locations are requested concurrently, with at most `max_concurrency` requests in flight.
+    #[pyo3(text_signature = "($self, locations, max_concurrency)")]
+    #[args(max_concurrency = "DEFAULT_MAX_CONCURRENCY")]
+    fn head_many(
+        &self,
+        locations: Vec<&PyAny>,
+        max_concurrency: usize,
+    ) -> PyResult<Vec<PyObjectMeta>> {
+        let paths = locations
+            .into_iter()
+            .map(to_path)
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(self
+            .rt
+            .block_on(head_many(self.inner.as_ref(), &paths, max_concurrency))
+            .map_err(ObjectStoreError::from)?
+            .into_iter()
+            .map(PyObjectMeta::from)
+            .collect())
+    }
+
+    /// Delete the objects at the specified locations.
+    ///
+    /// All objects are deleted concurrently, with at most `max_concurrency` requests in flight.
+    #[pyo3(text_signature = "($self, locations, max_concurrency)")]
+    #[args(max_concurrency = "DEFAULT_MAX_CONCURRENCY")]
+    fn delete_many(&self, locations: Vec<&PyAny>, max_concurrency: usize) -> PyResult<()> {
+        let paths = locations
+            .into_iter()
+            .map(to_path)
+            .collect::<PyResult<Vec<_>>>()?;
+        self.rt
+            .block_on(delete_many(self.inner.as_ref(), &paths, max_concurrency))
+            .map_err(ObjectStoreError::from)?;
+        Ok(())
+    }
+
     /// Delete the object at the specified location.
     #[pyo3(text_signature = "($self, location)")]
-    fn delete(&self, location: PyPath) -> PyResult<()> {
+    fn delete(&self, location: &PyAny) -> PyResult<()> {
         self.rt
-            .block_on(self.inner.delete(&location.into()))
+            .block_on(self.inner.delete(&to_path(location)?))
             .map_err(ObjectStoreError::from)?;
         Ok(())
     }
@@ -298,14 +634,20 @@ impl PyObjectStore {
     /// List all the objects with the given prefix.
     ///
     /// Prefixes are evaluated on a path segment basis, i.e. `foo/bar/` is a prefix
-    /// of `foo/bar/x` but not of `foo/bar_baz/x`.
-    #[pyo3(text_signature = "($self, prefix)")]
-    fn list(&self, prefix: Option<PyPath>) -> PyResult<Vec<PyObjectMeta>> {
+    /// of `foo/bar/x` but not of `foo/bar_baz/x`. A trailing delimiter is implied,
+    /// so `foo/bar` and `foo/bar/` list the same objects.
+    ///
+    /// At most `max_keys` objects are returned, if given.
+    #[pyo3(text_signature = "($self, prefix, max_keys)")]
+    #[args(prefix = "None", max_keys = "None")]
+    fn list(&self, prefix: Option<&PyAny>, max_keys: Option<usize>) -> PyResult<Vec<PyObjectMeta>> {
+        let prefix = prefix.map(to_path).transpose()?;
         Ok(self
             .rt
             .block_on(flatten_list_stream(
                 self.inner.as_ref(),
-                prefix.map(Path::from).as_ref(),
+                prefix.as_ref(),
+                max_keys,
             ))
             .map_err(ObjectStoreError::from)?
             .into_iter()
@@ -313,31 +655,74 @@ impl PyObjectStore {
             .collect())
     }
 
+    /// Iterate over all the objects with the given prefix.
+    ///
+    /// Objects are listed in the background while the iterator is consumed, so the first
+    /// results are available before the full listing completes. At most `max_keys` objects
+    /// are returned, if given.
+    ///
+    /// The listing does not count against `max_in_flight`, as it remains in flight while
+    /// the iterator is consumed, which may involve other requests to this store.
+    #[pyo3(text_signature = "($self, prefix, max_keys)")]
+    #[args(prefix = "None", max_keys = "None")]
+    fn iter_list(
+        &self,
+        prefix: Option<&PyAny>,
+        max_keys: Option<usize>,
+    ) -> PyResult<PyListIterator> {
+        let prefix = prefix.map(to_path).transpose()?;
+        let (tx, rx) = mpsc::channel(LIST_BUFFER_SIZE);
+        self.rt.spawn(send_list_stream(
+            self.unlimited.clone(),
+            prefix,
+            max_keys,
+            tx,
+        ));
+        Ok(PyListIterator {
+            rx,
+            rt: self.rt.clone(),
+        })
+    }
+
     /// List objects with the given prefix and an implementation specific
     /// delimiter. Returns common prefixes (directories) in addition to object
     /// metadata.
     ///
     /// Prefixes are evaluated on a path segment basis, i.e. `foo/bar/` is a prefix
-    /// of `foo/bar/x` but not of `foo/bar_baz/x`.
+    /// of `foo/bar/x` but not of `foo/bar_baz/x`. A trailing delimiter is implied,
+    /// so `foo/bar` and `foo/bar/` list the same objects.
     #[pyo3(text_signature = "($self, prefix)")]
-    fn list_with_delimiter(&self, prefix: Option<PyPath>) -> PyResult<PyListResult> {
+    #[args(prefix = "None")]
+    fn list_with_delimiter(&self, prefix: Option<&PyAny>) -> PyResult<PyListResult> {
+        let prefix = prefix.map(to_path).transpose()?;
         let list = self
             .rt
-            .block_on(
-                self.inner
-                    .list_with_delimiter(prefix.map(Path::from).as_ref()),
-            )
+            .block_on(self.inner.list_with_delimiter(prefix.as_ref()))
             .map_err(ObjectStoreError::from)?;
         Ok(list.into())
     }
 
+    /// List the common prefixes (directories) directly below the given prefix.
+    ///
+    /// Unlike `list_with_delimiter`, no metadata for the listed objects is returned.
+    #[pyo3(text_signature = "($self, prefix)")]
+    #[args(prefix = "None")]
+    fn list_prefixes(&self, prefix: Option<&PyAny>) -> PyResult<Vec<PyPath>> {
+        let prefix = prefix.map(to_path).transpose()?;
+        let list = self
+            .rt
+            .block_on(self.inner.list_with_delimiter(prefix.as_ref()))
+            .map_err(ObjectStoreError::from)?;
+        Ok(list.common_prefixes.into_iter().map(PyPath::from).collect())
+    }
+
     /// Copy an object from one path to another in the same object store.
     ///
     /// If there exists an object at the destination, it will be overwritten.
-    #[pyo3(text_signature = "($self, from, to)")]
-    fn copy(&self, from: PyPath, to: PyPath) -> PyResult<()> {
+    #[pyo3(text_signature = "($self, src, dst)")]
+    fn copy(&self, src: &PyAny, dst: &PyAny) -> PyResult<()> {
         self.rt
-            .block_on(self.inner.copy(&from.into(), &to.into()))
+            .block_on(self.inner.copy(&to_path(src)?, &to_path(dst)?))
             .map_err(ObjectStoreError::from)?;
         Ok(())
     }
@@ -345,10 +730,13 @@ impl PyObjectStore {
     /// Copy an object from one path to another, only if destination is empty.
     ///
     /// Will return an error if the destination already has an object.
-    #[pyo3(text_signature = "($self, from, to)")]
-    fn copy_if_not_exists(&self, from: PyPath, to: PyPath) -> PyResult<()> {
+    #[pyo3(text_signature = "($self, src, dst)")]
+    fn copy_if_not_exists(&self, src: &PyAny, dst: &PyAny) -> PyResult<()> {
         self.rt
-            .block_on(self.inner.copy_if_not_exists(&from.into(), &to.into()))
+            .block_on(
+                self.inner
+                    .copy_if_not_exists(&to_path(src)?, &to_path(dst)?),
+            )
             .map_err(ObjectStoreError::from)?;
         Ok(())
     }
@@ -359,10 +747,10 @@ impl PyObjectStore {
     /// check when deleting source that it was the same object that was originally copied.
     ///
     /// If there exists an object at the destination, it will be overwritten.
-    #[pyo3(text_signature = "($self, from, to)")]
-    fn rename(&self, from: PyPath, to: PyPath) -> PyResult<()> {
+    #[pyo3(text_signature = "($self, src, dst)")]
+    fn rename(&self, src: &PyAny, dst: &PyAny) -> PyResult<()> {
         self.rt
-            .block_on(self.inner.rename(&from.into(), &to.into()))
+            .block_on(self.inner.rename(&to_path(src)?, &to_path(dst)?))
             .map_err(ObjectStoreError::from)?;
         Ok(())
     }
@@ -370,16 +758,26 @@ impl PyObjectStore {
     /// Move an object from one path to another in the same object store.
     ///
     /// Will return an error if the destination already has an object.
-    #[pyo3(text_signature = "($self, from, to)")]
-    fn rename_if_not_exists(&self, from: PyPath, to: PyPath) -> PyResult<()> {
+    #[pyo3(text_signature = "($self, src, dst)")]
+    fn rename_if_not_exists(&self, src: &PyAny, dst: &PyAny) -> PyResult<()> {
         self.rt
-            .block_on(self.inner.rename_if_not_exists(&from.into(), &to.into()))
+            .block_on(
+                self.inner
+                    .rename_if_not_exists(&to_path(src)?, &to_path(dst)?),
+            )
             .map_err(ObjectStoreError::from)?;
         Ok(())
     }
 
-    pub fn __getnewargs__(&self) -> PyResult<(String, Option<HashMap<String, String>>)> {
-        Ok((self.root_url.clone(), self.options.clone()))
+    #[allow(clippy::type_complexity)]
+    pub fn __getnewargs__(
+        &self,
+    ) -> PyResult<(String, Option<HashMap<String, String>>, Option<usize>)> {
+        Ok((
+            self.root_url.clone(),
+            self.options.clone(),
+            self.max_in_flight,
+        ))
     }
 }
 
@@ -390,6 +788,8 @@ fn _internal(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PyPath>()?;
     m.add_class::<PyObjectMeta>()?;
     m.add_class::<PyListResult>()?;
+    m.add_class::<PyListIterator>()?;
+    m.add_class::<PyRangeIterator>()?;
     m.add_class::<ArrowFileSystemHandler>()?;
     m.add_class::<ObjectInputFile>()?;
     m.add_class::<ObjectOutputStream>()?;
@@ -1,22 +1,63 @@
+use std::cmp::Reverse;
+use std::ops::Range;
 use std::sync::Arc;
 
+use bytes::Bytes;
 use futures::future::{join_all, BoxFuture, FutureExt};
-use futures::{StreamExt, TryStreamExt};
+use futures::{stream, StreamExt, TryStreamExt};
 use object_store::path::Path;
-use object_store::{DynObjectStore, ListResult, ObjectMeta, Result as ObjectStoreResult};
+use object_store::{DynObjectStore, Error, ListResult, ObjectMeta, Result as ObjectStoreResult};
+use tokio::sync::mpsc::Sender;
+
+/// Default number of requests a batch operation keeps in flight
+pub const DEFAULT_MAX_CONCURRENCY: usize = 64;
+
+/// Ranges separated by at most this many bytes are fetched in a single request
+const RANGE_COALESCE_GAP: usize = 1024 * 1024;
+
+/// Upper bound for the size of a single coalesced range request
+const RANGE_COALESCE_MAX: usize = 16 * 1024 * 1024;
+
+/// Number of listed objects buffered ahead of the consumer of a list iterator
+pub const LIST_BUFFER_SIZE: usize = 1000;
 
 /// List directory
 pub async fn flatten_list_stream(
     storage: &DynObjectStore,
     prefix: Option<&Path>,
+    max_keys: Option<usize>,
 ) -> ObjectStoreResult<Vec<ObjectMeta>> {
     storage
         .list(prefix)
         .await?
+        .take(max_keys.unwrap_or(usize::MAX))
         .try_collect::<Vec<ObjectMeta>>()
         .await
 }
 
+/// Forward listed objects into a channel, until the listing is exhausted, fails
+/// or the receiving end is dropped.
+pub async fn send_list_stream(
+    storage: Arc<DynObjectStore>,
+    prefix: Option<Path>,
+    max_keys: Option<usize>,
+    tx: Sender<ObjectStoreResult<ObjectMeta>>,
+) {
+    let mut stream = match storage.list(prefix.as_ref()).await {
+        Ok(stream) => stream.take(max_keys.unwrap_or(usize::MAX)),
+        Err(err) => {
+            let _ = tx.send(Err(err)).await;
+            return;
+        }
+    };
+    while let Some(item) = stream.next().await {
+        let failed = item.is_err();
+        if tx.send(item).await.is_err() || failed {
+            break;
+        }
+    }
+}
+
 pub async fn walk_tree(
     storage: Arc<DynObjectStore>,
     path: &Path,
@@ -75,17 +116,212 @@ fn list_with_delimiter_recursive(
     .boxed()
 }
 
+/// The kind of entry found at a path
+pub enum FileStatus {
+    Directory,
+    File(ObjectMeta),
+    NotFound,
+}
+
+async fn file_status(storage: &DynObjectStore, path: &Path) -> ObjectStoreResult<FileStatus> {
+    let listed = storage.list_with_delimiter(Some(path)).await?;
+    // TODO is there a better way to figure out if we are in a directory?
+    if !listed.objects.is_empty() || !listed.common_prefixes.is_empty() {
+        return Ok(FileStatus::Directory);
+    }
+    match storage.head(path).await {
+        Ok(meta) => Ok(FileStatus::File(meta)),
+        Err(Error::NotFound { .. }) => Ok(FileStatus::NotFound),
+        Err(err) => Err(err),
+    }
+}
+
+/// Determine if paths are directories, files or missing, checking all paths concurrently
+pub async fn file_status_many(
+    storage: &DynObjectStore,
+    paths: &[Path],
+    max_concurrency: usize,
+) -> ObjectStoreResult<Vec<FileStatus>> {
+    stream::iter(paths)
+        .map(|path| file_status(storage, path))
+        .buffered(max_concurrency.max(1))
+        .try_collect()
+        .await
+}
+
 pub async fn delete_dir(storage: &DynObjectStore, prefix: &Path) -> ObjectStoreResult<()> {
-    // TODO batch delete would be really useful now...
-    let mut stream = storage.list(Some(prefix)).await?;
-    while let Some(maybe_meta) = stream.next().await {
-        let meta = maybe_meta?;
-        storage.delete(&meta.location).await?;
+    // collect the listing first, so the list request does not hold on to a request
+    // slot of a concurrency limited store while deleting.
+    let paths = storage
+        .list(Some(prefix))
+        .await?
+        .map_ok(|meta| meta.location)
+        .try_collect::<Vec<_>>()
+        .await?;
+    delete_many(storage, &paths, DEFAULT_MAX_CONCURRENCY).await
+}
+
+/// get metadata for multiple locations, keeping at most `max_concurrency` requests in flight
+pub async fn head_many(
+    storage: &DynObjectStore,
+    paths: &[Path],
+    max_concurrency: usize,
+) -> ObjectStoreResult<Vec<ObjectMeta>> {
+    stream::iter(paths)
+        .map(|path| storage.head(path))
+        .buffered(max_concurrency.max(1))
+        .try_collect()
+        .await
+}
+
+/// delete multiple locations, keeping at most `max_concurrency` requests in flight
+pub async fn delete_many(
+    storage: &DynObjectStore,
+    paths: &[Path],
+    max_concurrency: usize,
+) -> ObjectStoreResult<()> {
+    stream::iter(paths)
+        .map(Ok)
+        .try_for_each_concurrent(max_concurrency.max(1), |path| storage.delete(path))
+        .await
+}
+
+/// get bytes from a location
+pub async fn get_bytes(storage: &DynObjectStore, path: &Path) -> ObjectStoreResult<Bytes> {
+    storage.get(path).await?.bytes().await
+}
+
+/// get a byte range from a location.
+///
+/// This always issues a single ranged GET request, without a preceding HEAD request
+/// to validate the range. Empty ranges are answered without contacting the store.
+pub async fn get_range(
+    storage: &DynObjectStore,
+    path: &Path,
+    range: Range<usize>,
+) -> ObjectStoreResult<Bytes> {
+    if range.is_empty() {
+        return Ok(Bytes::new());
     }
+    storage.get_range(path, range).await
+}
+
+/// get bytes from multiple locations, keeping at most `max_concurrency` requests in flight
+pub async fn get_many(
+    storage: &DynObjectStore,
+    paths: &[Path],
+    max_concurrency: usize,
+) -> ObjectStoreResult<Vec<Bytes>> {
+    stream::iter(paths)
+        .map(|path| async move { storage.get(path).await?.bytes().await })
+        .buffered(max_concurrency.max(1))
+        .try_collect()
+        .await
+}
+
+/// put bytes to multiple locations, keeping at most `max_concurrency` requests in flight
+pub async fn put_many(
+    storage: &DynObjectStore,
+    items: Vec<(Path, Bytes)>,
+    max_concurrency: usize,
+) -> ObjectStoreResult<()> {
+    stream::iter(items)
+        .map(|(path, bytes)| async move { storage.put(&path, bytes).await })
+        .buffer_unordered(max_concurrency.max(1))
+        .try_collect::<Vec<_>>()
+        .await?;
     Ok(())
 }
 
-/// get bytes from a location
-pub async fn get_bytes(storage: &DynObjectStore, path: &Path) -> ObjectStoreResult<Vec<u8>> {
-    Ok(storage.get(path).await?.bytes().await?.into())
+/// Merge ranges that are close to each other into larger (sorted) ranges. Returns the merged
+/// ranges along with the index of the merged range that fully contains each input range.
+fn coalesce_ranges(ranges: &[Range<usize>]) -> (Vec<Range<usize>>, Vec<usize>) {
+    let mut order: Vec<usize> = (0..ranges.len()).collect();
+    order.sort_unstable_by_key(|&idx| (ranges[idx].start, Reverse(ranges[idx].end)));
+
+    let mut coalesced: Vec<Range<usize>> = Vec::with_capacity(ranges.len());
+    let mut windows = vec![0; ranges.len()];
+    for idx in order {
+        let range = &ranges[idx];
+        match coalesced.last_mut() {
+            // a range contained in the previous one never needs a request of its own,
+            // no matter how large the previous one is
+            Some(last) if range.end <= last.end => {}
+            Some(last)
+                if range.start <= last.end + RANGE_COALESCE_GAP
+                    && range.end - last.start <= RANGE_COALESCE_MAX =>
+            {
+                last.end = range.end;
+            }
+            _ => coalesced.push(range.clone()),
+        }
+        windows[idx] = coalesced.len() - 1;
+    }
+    (coalesced, windows)
+}
+
+/// get multiple byte ranges from a location, coalescing nearby ranges into fewer requests
+pub async fn get_ranges(
+    storage: &DynObjectStore,
+    path: &Path,
+    ranges: &[Range<usize>],
+    max_concurrency: usize,
+) -> ObjectStoreResult<Vec<Bytes>> {
+    let (fetch_ranges, windows) = coalesce_ranges(ranges);
+    let fetched: Vec<Bytes> = stream::iter(fetch_ranges.iter().cloned())
+        .map(|range| get_range(storage, path, range))
+        .buffered(max_concurrency.max(1))
+        .try_collect()
+        .await?;
+
+    Ok(ranges
+        .iter()
+        .zip(windows)
+        .map(|(range, idx)| {
+            let offset = fetch_ranges[idx].start;
+            fetched[idx].slice(range.start - offset..range.end - offset)
+        })
+        .collect())
+}
+
+/// Fetch byte ranges from a location and forward `(index, bytes)` for every requested
+/// range into a channel, as soon as the coalesced request containing it completes.
+pub async fn send_ranges(
+    storage: Arc<DynObjectStore>,
+    path: Path,
+    ranges: Vec<Range<usize>>,
+    max_concurrency: usize,
+    tx: Sender<ObjectStoreResult<(usize, Bytes)>>,
+) {
+    let (fetch_ranges, windows) = coalesce_ranges(&ranges);
+    let mut members = vec![Vec::new(); fetch_ranges.len()];
+    for (idx, window) in windows.into_iter().enumerate() {
+        members[window].push(idx);
+    }
+
+    let storage = storage.as_ref();
+    let path = &path;
+    let mut fetches = stream::iter(fetch_ranges.into_iter().zip(members))
+        .map(|(fetch, members)| async move {
+            let bytes = get_range(storage, path, fetch.clone()).await?;
+            Ok::<_, Error>((fetch.start, bytes, members))
+        })
+        .buffer_unordered(max_concurrency.max(1));
+
+    while let Some(fetched) = fetches.next().await {
+        let (offset, bytes, members) = match fetched {
+            Ok(fetched) => fetched,
+            Err(err) => {
+                let _ = tx.send(Err(err)).await;
+                return;
+            }
+        };
+        for idx in members {
+            let range = &ranges[idx];
+            let part = bytes.slice(range.start - offset..range.end - offset);
+            if tx.send(Ok((idx, part))).await.is_err() {
+                return;
+            }
+        }
+    }
 }
@@ -10,6 +10,7 @@ import pyarrow.fs as fs
 import pyarrow.parquet as pq
 import pytest
 
+from object_store import ObjectStore
 from object_store.arrow import ArrowFileSystemHandler
 
 
@@ -42,6 +43,20 @@ def test_file_info(file_systems: tuple[fs.PyFileSystem, fs.SubTreeFileSystem], t
     assert info.mtime == arrow_info.mtime
 
 
+def test_get_file_info_many(file_systems: tuple[fs.PyFileSystem, fs.SubTreeFileSystem], table_data):
+    store, arrow_fs = file_systems
+    pq.write_table(table_data, "table.parquet", filesystem=arrow_fs)
+    pq.write_table(table_data, "dir/table.parquet", filesystem=arrow_fs)
+
+    paths = ["table.parquet", "dir", "missing.parquet"]
+    infos = store.get_file_info(paths)
+    arrow_infos = arrow_fs.get_file_info(paths)
+
+    assert [info.path for info in infos] == paths
+    assert [info.type for info in infos] == [info.type for info in arrow_infos]
+    assert infos[0].size == arrow_infos[0].size
+
+
 def test_get_file_info_selector(file_systems: tuple[fs.PyFileSystem, fs.SubTreeFileSystem]):
     store, arrow_fs = file_systems
     table = pa.table({"a": range(10), "b": np.random.randn(10), "c": [1, 2] * 5})
@@ -163,3 +178,58 @@ def test_write_partitioned_dataset(file_systems: tuple[fs.PyFileSystem, fs.SubTr
     assert table.schema == ds_table2.schema
     assert table.shape == ds_table.shape
     assert table.shape == ds_table2.shape
+
+
+def test_move_and_open_input_stream(file_systems: tuple[fs.PyFileSystem, fs.SubTreeFileSystem], table_data):
+    store, arrow_fs = file_systems
+    pq.write_table(table_data, "table.parquet", filesystem=arrow_fs)
+
+    store.move("table.parquet", "moved.parquet")
+
+    assert store.get_file_info("table.parquet").type == fs.FileType.NotFound
+    with store.open_input_stream("moved.parquet") as stream:
+        with arrow_fs.open_input_stream("moved.parquet") as arrow_stream:
+            assert stream.read() == arrow_stream.read()
+
+
+def test_output_stream_batches_writes(datadir: Path):
+    store = fs.PyFileSystem(ArrowFileSystemHandler(str(datadir.absolute()), write_batch_size=16))
+
+    chunks = [bytes([i]) * 5 for i in range(10)]
+    with store.open_output_stream("batched.bin") as stream:
+        for chunk in chunks:
+            stream.write(chunk)
+        assert stream.tell() == 50
+
+    with store.open_input_stream("batched.bin") as stream:
+        assert stream.read() == b"".join(chunks)
+
+
+def test_handler_for_url(datadir: Path, table_data):
+    handler = ArrowFileSystemHandler.for_url(str(datadir.absolute()))
+    store = fs.PyFileSystem(handler)
+
+    pq.write_table(table_data, "table.parquet", filesystem=store)
+    assert pq.read_table("table.parquet", filesystem=store).equals(table_data)
+
+    # the handler writes through the same store
+    assert ObjectStore.get_or_create(str(datadir.absolute())).head("table.parquet").size > 0
+
+    with pytest.raises(ValueError):
+        ArrowFileSystemHandler(str(datadir.absolute()), {"key": "value"}, store=ObjectStore(str(datadir.absolute())))
+    with pytest.raises(ValueError):
+        ArrowFileSystemHandler("memory://", store=ObjectStore(str(datadir.absolute())))
+
+
+def test_shared_store_output_streams(datadir: Path):
+    root = str(datadir.absolute())
+    store = ObjectStore(root, max_in_flight=2)
+    handler = ArrowFileSystemHandler(root, store=store)
+
+    # more open streams than the store allows requests in flight
+    streams = [handler.open_output_stream(f"streams/file{i}") for i in range(5)]
+    for stream in streams:
+        stream.write(b"data")
+        stream.close()
+
+    assert len(store.list("streams")) == 5
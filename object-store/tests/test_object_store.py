@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import gc
+import pickle
+import weakref
+from io import BytesIO
 from pathlib import Path
 
 import pytest
@@ -53,6 +57,7 @@ def test_put_get_delete_list(object_store: tuple[ObjectStore, Path]):
 
     range_result = store.get_range(location, 3, 4)
     assert range_result == expected_data[3:7]
+    assert store.get_range(location, 3, 0) == b""
 
     with pytest.raises(Exception):
         store.get_range(location, 200, 100)
@@ -98,3 +103,278 @@ def test_rename_and_copy(object_store: tuple[ObjectStore, Path]):
         store.get(path1)
 
     store.delete(path2)
+
+
+def test_get_many_and_ranges(object_store: tuple[ObjectStore, Path]):
+    store, _ = object_store
+
+    data = {f"batch/file{i}": f"data {i}".encode() for i in range(10)}
+    for location, contents in data.items():
+        store.put(location, contents)
+
+    assert store.get_many(list(data.keys())) == list(data.values())
+    assert store.get_many(list(data.keys()), max_concurrency=1) == list(data.values())
+    assert store.get_many([]) == []
+
+    location = ObjectStorePath("batch/ranges")
+    expected_data = bytes(range(256)) * 16
+    store.put(location, expected_data)
+
+    ranges = [(100, 10), (0, 5), (3, 20), (4000, 96), (50, 0)]
+    result = store.get_ranges(location, ranges)
+    assert result == [expected_data[start : start + length] for start, length in ranges]
+    assert store.get_ranges(location, []) == []
+
+    streamed = list(store.get_ranges_stream(location, ranges, max_concurrency=2))
+    expected = [(idx, expected_data[start : start + length]) for idx, (start, length) in enumerate(ranges)]
+    assert sorted(streamed) == expected
+    assert list(store.get_ranges_stream(location, [])) == []
+
+    # ranges sharing a start with a range larger than the coalescing limit
+    location = ObjectStorePath("batch/large")
+    large_data = bytes(range(256)) * (20 * 4096)
+    store.put(location, large_data)
+
+    ranges = [(0, len(large_data)), (0, 5), (10, 20)]
+    expected = [large_data[start : start + length] for start, length in ranges]
+    assert store.get_ranges(location, ranges) == expected
+    assert sorted(store.get_ranges_stream(location, ranges)) == list(enumerate(expected))
+
+
+def test_path_like_arguments(object_store: tuple[ObjectStore, Path]):
+    store, _ = object_store
+
+    expected_data = b"arbitrary data"
+    store.put(["nested", "dir", "file"], expected_data)
+
+    assert store.get("nested/dir/file") == expected_data
+    assert store.get(["nested", "dir", "file"]) == expected_data
+    assert store.get(ObjectStorePath(["nested", "dir", "file"])) == expected_data
+    assert store.list("nested")[0].location == ObjectStorePath("nested/dir/file")
+
+    with pytest.raises(ValueError):
+        store.get(42)
+
+
+def test_list_prefixes(object_store: tuple[ObjectStore, Path]):
+    store, _ = object_store
+
+    store.put("root_file", b"data")
+    store.put("dir_a/file", b"data")
+    store.put("dir_a/nested/file", b"data")
+    store.put("dir_b/file", b"data")
+
+    prefixes = sorted(str(p) for p in store.list_prefixes())
+    assert prefixes == ["dir_a", "dir_b"]
+    assert prefixes == sorted(str(p) for p in store.list_with_delimiter().common_prefixes)
+
+    assert store.list_prefixes("dir_a") == [ObjectStorePath("dir_a/nested")]
+    assert store.list_prefixes("dir_b") == []
+
+
+def test_list_prefix_is_segment_based(object_store: tuple[ObjectStore, Path]):
+    store, _ = object_store
+
+    store.put("foo/bar/x", b"data")
+    store.put("foo/bar_baz/x", b"data")
+
+    expected = [ObjectStorePath("foo/bar/x")]
+    assert [meta.location for meta in store.list("foo/bar")] == expected
+    assert [meta.location for meta in store.list("foo/bar/")] == expected
+    assert [meta.location for meta in store.list_with_delimiter("foo/bar").objects] == expected
+    assert [meta.location for meta in store.list_with_delimiter("foo/bar/").objects] == expected
+
+
+def test_iter_list(object_store: tuple[ObjectStore, Path]):
+    store, _ = object_store
+
+    locations = [f"iter/file{i}" for i in range(20)]
+    for location in locations:
+        store.put(location, b"data")
+
+    listed = [str(meta.location) for meta in store.iter_list("iter")]
+    assert sorted(listed) == sorted(locations)
+
+    assert len(list(store.iter_list("iter", max_keys=5))) == 5
+    assert len(store.list("iter", max_keys=5)) == 5
+    assert list(store.iter_list("something")) == []
+
+
+def test_metadata_caches(datadir: Path):
+    store = ObjectStore(str(datadir), meta_cache_size=8, negative_cache_size=8)
+    assert isinstance(store, ObjectStore)
+    location = "cached/file"
+
+    with pytest.raises(FileNotFoundError):
+        store.head(location)
+    with pytest.raises(FileNotFoundError):
+        store.get(location)
+
+    # writing through the store invalidates the negative cache
+    store.put(location, b"data")
+    assert store.head(location).size == 4
+
+    # objects modified outside of the store are served from the cache
+    (datadir / "cached" / "file").write_bytes(b"more data")
+    assert store.head(location).size == 4
+
+    store.put(location, b"more data")
+    assert store.head(location).size == 9
+
+    store.rename(location, "cached/other")
+    with pytest.raises(FileNotFoundError):
+        store.head(location)
+    assert store.head("cached/other").size == 9
+
+    store.delete("cached/other")
+    with pytest.raises(FileNotFoundError):
+        store.head("cached/other")
+
+    # locations may be given as any iterable
+    store.put_many((name, b"data") for name in ["cached/a", "cached/b"])
+    assert store.head("cached/a").size == 4
+    store.delete_many(name for name in ["cached/a", "cached/b"])
+    with pytest.raises(FileNotFoundError):
+        store.head("cached/a")
+
+
+def test_caches_in_subclass(datadir: Path):
+    class CustomStore(ObjectStore):
+        def __init__(self, root: str, options: dict[str, str] | None = None, **kwargs) -> None:
+            super().__init__(root, options, **kwargs)
+
+    store = CustomStore(str(datadir), meta_cache_size=8, negative_cache_size=8)
+    assert isinstance(store, CustomStore)
+
+    with pytest.raises(FileNotFoundError):
+        store.head("custom/file")
+
+    # missing objects are remembered until written through the store
+    (datadir / "custom").mkdir()
+    (datadir / "custom" / "file").write_bytes(b"data")
+    with pytest.raises(FileNotFoundError):
+        store.head("custom/file")
+
+    store = ObjectStore(str(datadir), meta_cache_size=8)
+    restored = pickle.loads(pickle.dumps(store))
+    assert type(restored) is type(store)
+    assert restored.head("custom/file").size == 4
+
+
+def test_max_in_flight(datadir: Path):
+    store = ObjectStore(str(datadir), max_in_flight=1)
+
+    data = {f"limited/file{i}": f"data {i}".encode() for i in range(10)}
+    for location, contents in data.items():
+        store.put(location, contents)
+
+    assert store.get_many(list(data.keys())) == list(data.values())
+    assert len(store.list("limited")) == len(data)
+
+    # requests can be issued while a listing is in progress
+    for meta in store.iter_list("limited"):
+        assert store.get(meta.location) == data[str(meta.location)]
+
+    unlimited = ObjectStore(str(datadir), max_in_flight=None)
+    assert unlimited.get_many(list(data.keys())) == list(data.values())
+
+    with pytest.raises(ValueError):
+        ObjectStore(str(datadir), max_in_flight=0)
+
+
+def test_get_or_create(datadir: Path):
+    store = ObjectStore.get_or_create(str(datadir))
+
+    assert ObjectStore.get_or_create(str(datadir)) is store
+    assert ObjectStore.get_or_create(str(datadir), {"key": "value"}) is not store
+
+    # the shared store is released once it is no longer used
+    ref = weakref.ref(store)
+    del store
+    gc.collect()
+    assert ref() is None
+
+
+def test_put_many_and_multipart(object_store: tuple[ObjectStore, Path]):
+    store, _ = object_store
+
+    data = {f"upload/file{i}": f"data {i}".encode() for i in range(10)}
+    store.put_many(list(data.items()))
+    assert store.get_many(list(data.keys())) == list(data.values())
+
+    # three parts, the last one smaller than the others
+    expected_data = bytes(range(256)) * (12 * 4096)
+    store.put_multipart("upload/large", expected_data, part_size=5 * 1024 * 1024)
+    assert store.get("upload/large") == expected_data
+
+    with pytest.raises(ValueError):
+        store.put_multipart("upload/large", expected_data, part_size=1000)
+
+
+def test_put_bytes_like(object_store: tuple[ObjectStore, Path]):
+    store, _ = object_store
+
+    expected_data = b"arbitrary data"
+
+    buffer = BytesIO(expected_data)
+    buffer.seek(5)
+    store.put("bytes_like/bytes_io", buffer)
+    assert store.get("bytes_like/bytes_io") == expected_data
+
+    store.put("bytes_like/bytearray", bytearray(expected_data))
+    assert store.get("bytes_like/bytearray") == expected_data
+
+    store.put("bytes_like/memoryview", memoryview(expected_data))
+    assert store.get("bytes_like/memoryview") == expected_data
+
+    with pytest.raises(ValueError):
+        store.put("bytes_like/invalid", "not bytes")
+
+
+def test_head_and_delete_many(object_store: tuple[ObjectStore, Path]):
+    store, _ = object_store
+
+    data = {f"bulk/file{i}": b"x" * i for i in range(10)}
+    store.put_many(list(data.items()))
+
+    metas = store.head_many(list(data.keys()))
+    assert [str(meta.location) for meta in metas] == list(data.keys())
+    assert [meta.size for meta in metas] == [len(contents) for contents in data.values()]
+
+    with pytest.raises(FileNotFoundError):
+        store.head_many(["bulk/file0", "bulk/missing"])
+
+    store.delete_many(list(data.keys()))
+    assert store.list("bulk") == []
+
+
+def test_path_hash_and_equality():
+    path = ObjectStorePath("a/b/c")
+
+    assert path == ObjectStorePath(["a", "b", "c"])
+    assert path != ObjectStorePath("a/b")
+    assert hash(path) == hash(ObjectStorePath("a/b/c"))
+    assert hash(path) == hash(path)
+
+    paths = {path, ObjectStorePath("a/b/c"), ObjectStorePath("a/b").child("c"), ObjectStorePath("a/b")}
+    assert len(paths) == 2
+    assert {path: 1}[ObjectStorePath("a/b/c")] == 1
+
+
+def test_list_cache(datadir: Path):
+    store = ObjectStore(str(datadir), list_cache_size=8, list_cache_ttl=60.0)
+    store.put("listed/file1", b"data")
+    assert len(store.list("listed")) == 1
+
+    # objects added outside of the store are not visible until the cache expires
+    (datadir / "listed" / "file2").write_bytes(b"data")
+    assert len(store.list("listed")) == 1
+
+    # modifications through the store clear the cache
+    store.put("listed/file3", b"data")
+    assert len(store.list("listed")) == 3
+
+    store = ObjectStore(str(datadir), list_cache_size=8, list_cache_ttl=0.0)
+    assert len(store.list("listed")) == 3
+    (datadir / "listed" / "file4").write_bytes(b"data")
+    assert len(store.list("listed")) == 4